@@ -3,52 +3,332 @@ Main CLI loop for llm_supercli.
 Handles the interactive command loop and message processing.
 """
 import asyncio
+import contextlib
 import json
 import os
 import re
-import sys
-from typing import Any, Optional, Tuple
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, NamedTuple, Optional, Tuple, Union
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from prompt_toolkit.formatted_text import HTML
 
 from .config import get_config
-from .rich_ui import RichRenderer, InputHandler, get_theme_manager
+from .rich_ui import RichRenderer
 from .rich_ui.prompt_input import PromptInput
-from .rich_ui.message_state import ToolCallRecord
+from .rich_ui.content_parser import parse_think_tags
 from .rich_ui.tool_action_mapper import ToolActionMapper
 from .rich_ui.layout_manager import LayoutManager, get_layout_manager
-from .rich_ui.status_bar import StatusBar, StatusBarData, get_status_bar
+from .rich_ui.status_bar import StatusBar, get_status_bar
 from .rich_ui.hints_bar import HintsBar, get_hints_bar
 from .command_system import CommandParser, get_command_registry
+from .command_system.base import AsyncSlashCommand
 from .history import get_session_store
 from .llm import get_provider_registry
 from .mcp import get_mcp_manager
-from .io_handlers import BashRunner, FileLoader, get_project_analysis_enforcer, get_file_creation_enforcer
+from .io_handlers import (
+    BashRunner,
+    ChunkDeduplicator,
+    FileLoader,
+    get_project_analysis_enforcer,
+    get_file_creation_enforcer,
+)
 from .completion_detector import CompletionDetector
 from .response_validator import ResponseValidator
 from .iteration_controller import IterationController
 from .context_calculator import ContextCalculator
 from .prompts import PromptBuilder, PromptConfig, SectionManager, ContextBuilder
-from .prompts.sections import (
-    RoleSection,
-    CapabilitiesSection,
-    ToolsSection,
-    RulesSection,
-    EnvironmentSection,
-    FormattingSection,
-)
-from .prompts.modes import ModeManager
+from .prompts.modes import ModeConfig, ModeManager
 from .prompts.rules import RulesLoader
 from .prompts.tools import (
-    ToolCatalog,
-    ToolDefinition,
     ToolExecutor,
-    get_builtin_tools,
     ToolParser,
     PythonStyleParser,
     XMLStyleParser,
     ParsedToolCall,
 )
-from .rich_ui.skipped_tool_detector import detect_skipped_tools
+from .rich_ui.skipped_tool_detector import find_skipped_tool, get_skipped_tool_detector
 from .rich_ui.streaming_progress import StreamingProgressIndicator, StreamingProgressConfig
+from .utils import count_tokens, warm_token_encoding
+
+
+# Providers shown as free in the status bar (OAuth or local)
+_FREE_PROVIDERS = frozenset({"qwen", "gemini", "ollama"})
+
+# Providers that don't require an API key (local or OAuth-based)
+_NO_KEY_PROVIDERS = frozenset({"ollama", "gemini", "qwen"})
+
+# Providers without native tool calling; they use text-based tool parsing.
+# Gemini supports native tool calling via functionCall, so it is not listed.
+_NO_TOOL_PROVIDERS = frozenset({"qwen", "groq"})
+
+# Prefix of .git/HEAD when a branch (rather than a detached commit) is checked out
+_HEAD_REF_PREFIX = 'ref: refs/heads/'
+
+# Tool names accepted from text-based tool calls; anything else is hallucinated
+_TOOL_NAMES = (
+    "read_file", "write_file", "list_directory",
+    "create_directory", "run_command", "get_current_directory",
+)
+_VALID_TOOLS: frozenset[str] = frozenset(_TOOL_NAMES)
+
+# Tools without side effects; consecutive calls to these may run concurrently
+_READ_ONLY_TOOLS = frozenset({"read_file", "list_directory", "get_current_directory"})
+
+# Positional argument names per tool, used to map arg0, arg1, ... to named parameters
+_PARAM_MAPPINGS = {
+    "read_file": ("path",),
+    "write_file": ("path", "content"),
+    "list_directory": ("path",),
+    "create_directory": ("path",),
+    "run_command": ("command",),
+    "get_current_directory": (),
+}
+
+# JSON decoder for native tool-call arguments; orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so callers catch the stdlib exception either way
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Streamed text is buffered and handed to the live display once this many
+# characters have accumulated or this many seconds have passed since the last flush
+_STREAM_FLUSH_CHARS = 64
+_STREAM_FLUSH_SECONDS = 0.03
+
+# Chunks a provider stream may be read ahead of the code consuming it
+_STREAM_READ_AHEAD = 64
+
+# @file attachments read from disk at once
+_FILE_LOAD_CONCURRENCY = 8
+
+# Shortened prompt paths remembered for directories visited in a session
+_PROMPT_PATH_CACHE_SIZE = 32
+
+# Only Windows paths need their separators normalized for the prompt
+_BACKSLASH_SEP = os.sep == '\\'
+
+# Anything Markdown would render differently from plain text: inline syntax,
+# entities, escapes, line breaks, and leading indentation or block markers
+_MARKDOWN_SYNTAX_RE = re.compile(r'[`*_#>\[\]!|<&~\\\n]|^\s|^(?:[-+=]|\d+[.)])')
+
+# Matches <think>...</think> reasoning blocks in model output
+_THINK_RE = re.compile(r'<think>(.*?)</think>', re.DOTALL)
+
+# Alternation of tool names used by the text-based tool-syntax scrubbers
+_TOOL_NAME_ALT = "|".join(map(re.escape, _TOOL_NAMES))
+
+# Start of a text-based tool call, used to find where the next call may begin
+# while the response is still streaming
+_TOOL_CALL_START_RE = re.compile(rf'\b(?:{_TOOL_NAME_ALT})\s*\(|<(?:{_TOOL_NAME_ALT})\b')
+
+# Python-style call of a known tool; without one (or any "<" for the XML
+# parser, which also accepts <invoke> blocks) no registered parser can match
+_PY_TOOL_CALL_RE = re.compile(rf'\b(?:{_TOOL_NAME_ALT})\s*\(')
+
+# Tool syntax stripped from displayed content of text-parsed responses, in one pass:
+# XML-style <tool(args)>...</tool> or <tool(args)>, Python-style tool(args),
+# and bare or malformed <tool> / </tool> tags
+_TOOL_SYNTAX_RE = re.compile(
+    r'<\w+\([^)]*\)>(?:[^<]*</\w+>)?'
+    rf'|\b(?:{_TOOL_NAME_ALT})\s*\([^)]*\)'
+    rf'|<\s*/\s*(?:{_TOOL_NAME_ALT})\s*>'
+    rf'|<(?:{_TOOL_NAME_ALT})>'
+)
+
+# Artifacts left once tool syntax is gone, in a second pass: empty code blocks,
+# lines holding only "<" and stray "python" language tags
+_SCRUB_ARTIFACTS_RE = re.compile(
+    r'```\s*```'
+    r'|(?m:^\s*<\s*$)'
+    r'|\bpython\b(?=\s*python|\s*$)'
+)
+
+# Substrings at least one of which any _TOOL_SYNTAX_RE or _SCRUB_ARTIFACTS_RE match contains
+_SCRUB_SENTINELS = ("<", "(", "`", "python")
+
+# Leftovers cleaned from the final response before it is shown: think tags,
+# tool-like tags and malformed closing tags, then lines left holding only "<"
+_FINAL_CLEAN_RE = re.compile(
+    r'</?think>?'
+    r'|<[^>]*\([^)]*\)[^>]*>'
+    r'|<\s*/\s*\w+\s*>'
+)
+_LT_ARTIFACT_RE = re.compile(r'^\s*<\s*$', re.MULTILINE)
+
+# Rich panel border characters a model may echo back; deleted via str.translate
+_BORDER_TRANS = str.maketrans("", "", "┏┓┗┛┃━")
+
+# Model info line printed above the input prompt: provider / model / mode / context%
+_PROMPT_INFO_TEMPLATE = (
+    "[cyan]{provider}[/cyan]"
+    " [rgb(138,43,226)]/[/rgb(138,43,226)] [rgb(138,43,226)]{model}[/rgb(138,43,226)]"
+    " [rgb(138,43,226)]/[/rgb(138,43,226)] [rgb(138,43,226)]{mode}[/rgb(138,43,226)]"
+    " [rgb(138,43,226)]/[/rgb(138,43,226)] [rgb(138,43,226)]{context}%[/rgb(138,43,226)]"
+)
+
+# Responses with no real content: bare punctuation, a lone filename/path, or a single word
+_USELESS_RESPONSE_RE = re.compile(
+    r'[\s.,!?\-_*]+'
+    r'|[\w\-./\\]+\.(?:py|txt|md|json|toml|yaml|yml|js|ts|html|css)'
+    r'|\w+',
+    re.IGNORECASE,
+)
+
+
+def _is_useless_response(content: str) -> bool:
+    """Check whether a final response carries no useful content.
+
+    Short responses such as greetings ("hi") are valid; only empty text and
+    the patterns in _USELESS_RESPONSE_RE are rejected.
+
+    Args:
+        content: The cleaned final response text.
+
+    Returns:
+        True if the response should be treated as useless.
+    """
+    stripped = content.strip()
+    if len(stripped) < 2:
+        return True
+    return _USELESS_RESPONSE_RE.fullmatch(stripped) is not None
+
+
+def _clean_final_content(text: str) -> str:
+    """Remove leftover think tags, tool syntax and panel borders from a final response."""
+    text = _FINAL_CLEAN_RE.sub('', text)
+    return _LT_ARTIFACT_RE.sub('', text).translate(_BORDER_TRANS).strip()
+
+
+@lru_cache(maxsize=32)
+def _parse_turn(
+    raw_response: str, tool_parser: ToolParser
+) -> Tuple[str, str, Tuple[ParsedToolCall, ...]]:
+    """Split a raw model turn into response/reasoning and parse its tool calls.
+
+    Both steps are pure functions of the text, so results are memoized; a
+    model that repeats itself across retries is only parsed once.
+
+    Args:
+        raw_response: The full streamed text of the turn.
+        tool_parser: Parser used to extract tool calls.
+
+    Returns:
+        Tuple of (response content, reasoning content, parsed tool calls).
+        The calls are shared between cache hits and must not be mutated.
+    """
+    parsed = parse_think_tags(raw_response)
+    content = parsed.response or ""
+    reasoning_content = parsed.reasoning
+
+    # Check both response content AND reasoning content (model sometimes puts tools in thinking)
+    all_content = "\n".join((content, reasoning_content or ""))
+    # XML-style calls need "<" and Python-style calls need a known tool name
+    # followed by "(", so plain chat (even with parentheses) skips parsing
+    if "<" not in all_content and not _PY_TOOL_CALL_RE.search(all_content):
+        return content, reasoning_content, ()
+    return content, reasoning_content, tuple(tool_parser.parse(all_content))
+
+
+class _ToolResult(NamedTuple):
+    """Outcome of one text-parsed tool call.
+
+    Attributes:
+        ok: Whether the tool ran without reporting an error.
+        is_unknown_tool: Whether the call named a tool that does not exist.
+        text: Result line for inclusion in the conversation.
+    """
+    ok: bool
+    is_unknown_tool: bool
+    text: str
+
+
+class _StreamCoalescer:
+    """Buffers streamed text and hands it to a sink in batches.
+
+    Rendering the live display costs far more than receiving a chunk, so
+    text is flushed once _STREAM_FLUSH_CHARS characters have accumulated or
+    _STREAM_FLUSH_SECONDS have passed since the last flush. Callers must
+    call flush() once the stream ends.
+    """
+
+    def __init__(self, sink: Callable[[str], None]) -> None:
+        self._sink = sink
+        self._pending: list[str] = []
+        self._pending_len = 0
+        self._last_flush = time.monotonic()
+
+    def add(self, text: str) -> None:
+        """Queue text, flushing if the size or time threshold is reached."""
+        if text:
+            self._pending.append(text)
+            self._pending_len += len(text)
+        if self._pending and (
+            self._pending_len >= _STREAM_FLUSH_CHARS
+            or time.monotonic() - self._last_flush >= _STREAM_FLUSH_SECONDS
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand any queued text to the sink."""
+        if self._pending:
+            self._sink("".join(self._pending))
+            self._pending.clear()
+            self._pending_len = 0
+        self._last_flush = time.monotonic()
+
+
+async def _read_ahead(stream: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    """Yield items from an async stream that a background task reads ahead.
+
+    The network read for the next chunks overlaps with whatever the caller
+    does per chunk, up to _STREAM_READ_AHEAD buffered items. Errors raised
+    by the stream are re-raised to the caller once buffered items are used.
+
+    Args:
+        stream: The async iterator to read, e.g. a provider's chat_stream().
+
+    Yields:
+        The stream's items, in order.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_STREAM_READ_AHEAD)
+    done = object()
+    errors: list[Exception] = []
+
+    async def produce() -> None:
+        try:
+            async for item in stream:
+                await queue.put(item)
+        except Exception as e:
+            errors.append(e)
+        await queue.put(done)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while (item := await queue.get()) is not done:
+            yield item
+        if errors:
+            raise errors[0]
+    finally:
+        # Stop reading if the caller stopped early, and close the stream so
+        # the underlying HTTP response is released
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
 
 class CLI:
@@ -99,21 +379,75 @@ class CLI:
         self._input.set_commands(self._commands.list_commands())
         
         # 7. Other components
+        # These do no network or subprocess work on construction (MCP servers
+        # connect on demand, providers are created on first use), so building
+        # them inline costs about as much as handing them to a thread pool
         self._sessions = get_session_store()
         self._providers = get_provider_registry()
         self._mcp = get_mcp_manager()
         self._bash = BashRunner()
         self._files = FileLoader()
         self._tools = ToolExecutor()
+        
+        # Compile the skipped-tool detector's patterns now rather than after
+        # the first response
+        get_skipped_tool_detector()
+        
+        # Loading the token encoding may download it; count_tokens estimates
+        # until it is ready
+        warm_token_encoding()
+        
+        # Text-based tool call parser, shared by every text-parsed turn
+        self._tool_parser = ToolParser()
+        self._tool_parser.register(PythonStyleParser())
+        self._tool_parser.register(XMLStyleParser())
+        
         self._running = False
         self._current_mode: str = "code"  # Default mode
         
+        # Single event loop reused for every shell/message turn instead of
+        # creating and tearing one down per input (uvloop when installed)
+        self._loop = uvloop.new_event_loop() if HAS_UVLOOP else asyncio.new_event_loop()
+        # Make it current so code calling get_event_loop() shares it
+        asyncio.set_event_loop(self._loop)
+        
+        # Git branch per directory, keyed on .git/HEAD mtime (see _get_git_branch)
+        self._branch_cache: dict[str, tuple[int, str]] = {}
+        
+        # Home directory and shortened prompt paths keyed on (cwd, is_compact)
+        self._home = os.path.expanduser('~')
+        self._prompt_path_cache: dict[tuple[str, bool], str] = {}
+        
+        # Working directory shared by the status bar and prompt; only
+        # re-read after an input has been processed (see _get_cwd)
+        self._cwd = os.getcwd()
+        self._cwd_dirty = False
+        
+        # Status bar is only recomputed after something that can change it
+        self._status_dirty = True
+        # Last context percentage as ((session_id, updated_at, message_count, max_tokens), percent)
+        self._context_percent_cache: Optional[Tuple[tuple, int]] = None
+        
         # Context calculator for consistent token estimation
         # Requirements: 2.1, 2.2, 2.3, 2.4 - Context percentage calculation
         self._context_calculator = ContextCalculator()
         
         # Initialize the new prompt system
         self._prompt_builder = self._create_prompt_builder()
+        # Built system prompts keyed on (mode, cwd, rules signature,
+        # include_mcp, tool catalog version); also cleared after tool calls
+        # that may have changed files
+        self._system_prompt_cache: dict[tuple[str, str, tuple, bool, int], str] = {}
+        
+        # Streaming progress indicator shared by all streaming turns
+        # Requirements: 5.1, 5.4 - Show "still thinking" indicator for extended silence
+        self._progress_indicator = StreamingProgressIndicator(
+            self._renderer.console,
+            config=StreamingProgressConfig(
+                thinking_timeout_seconds=5.0,
+                show_cancel_hint=True
+            )
+        )
         
         # Initialize ToolActionMapper for action cards integration
         # Requirements: 8.1, 8.2 - Automatically generate action cards for tool execution
@@ -128,6 +462,16 @@ class CLI:
         Returns:
             A configured PromptBuilder instance.
         """
+        from .prompts.sections import (
+            RoleSection,
+            CapabilitiesSection,
+            ToolsSection,
+            RulesSection,
+            EnvironmentSection,
+            FormattingSection,
+        )
+        from .prompts.tools import ToolCatalog, get_builtin_tools
+        
         # Create section manager and register default sections
         section_manager = SectionManager()
         section_manager.register(RoleSection())
@@ -167,16 +511,19 @@ class CLI:
         Returns:
             Tuple of (main_content, thinking_content)
         """
+        # Most responses have no thinking block; skip the regex entirely
+        if '<think>' not in content:
+            return content, ""
+        
         thinking = ""
         main_content = content
         
         # Extract thinking blocks
-        think_pattern = re.compile(r'<think>(.*?)</think>', re.DOTALL)
-        matches = think_pattern.findall(content)
+        matches = _THINK_RE.findall(content)
         
         if matches:
             thinking = "\n".join(matches)
-            main_content = think_pattern.sub('', content).strip()
+            main_content = _THINK_RE.sub('', content).strip()
         
         return main_content, thinking
     
@@ -205,35 +552,55 @@ class CLI:
         
         self._renderer.print()
         
-        while self._running:
+        try:
+            while self._running:
+                # The last input may have run a command that changed directory
+                self._cwd_dirty = True
+                try:
+                    # Mode cannot change while drawing one prompt; resolve it once
+                    mode_config = self._prompt_builder.mode_manager.get(self.current_mode)
+                    
+                    # Update status bar before each prompt
+                    # Requirements: 1.3, 1.4 - Real-time updates
+                    self._update_status_bar(mode_config)
+                    
+                    user_input = self._input.get_input(
+                        prompt=self._get_prompt(mode_config)
+                    )
+                    
+                    user_input = user_input.strip()
+                    if not user_input:
+                        continue
+                    
+                    self._process_input_sync(user_input)
+                    
+                except KeyboardInterrupt:
+                    self._renderer.print("\n[dim]Use /quit to exit[/dim]")
+                except EOFError:
+                    self._running = False
+                except Exception as e:
+                    self._renderer.print_error(f"Unexpected error: {e}")
+        finally:
+            # Mirror asyncio.run's cleanup before closing the shared loop
             try:
-                # Update status bar before each prompt
-                # Requirements: 1.3, 1.4 - Real-time updates
-                self._update_status_bar()
-                
-                user_input = self._input.get_input(
-                    prompt=self._get_prompt()
-                )
-                
-                if not user_input.strip():
-                    continue
-                
-                self._process_input_sync(user_input)
-                
-            except KeyboardInterrupt:
-                self._renderer.print("\n[dim]Use /quit to exit[/dim]")
-            except EOFError:
-                self._running = False
-            except Exception as e:
-                self._renderer.print_error(f"Unexpected error: {e}")
+                self._loop.run_until_complete(self._providers.aclose())
+                self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+                self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            finally:
+                asyncio.set_event_loop(None)
+                self._loop.close()
     
     def _process_input_sync(self, user_input: str) -> None:
-        """Process user input synchronously, only using async when necessary."""
+        """Process user input synchronously, only using async when necessary.
+        
+        Args:
+            user_input: The user input, already stripped by the caller.
+        """
         # Check for bash mode trigger (just "!")
-        if user_input.strip() == "!":
+        if user_input == "!":
             bash_cmd = self._get_bash_mode_input()
             if bash_cmd:
-                asyncio.run(self._handle_shell(bash_cmd))
+                self._loop.run_until_complete(self._handle_shell(bash_cmd))
             return
         
         parsed = self._parser.parse(user_input)
@@ -241,9 +608,9 @@ class CLI:
         if parsed.type == "command":
             self._handle_command_sync(parsed.command, parsed.args)
         elif parsed.type == "shell":
-            asyncio.run(self._handle_shell(parsed.shell_command))
+            self._loop.run_until_complete(self._handle_shell(parsed.shell_command))
         elif parsed.type == "message":
-            asyncio.run(self._handle_message(parsed.message, parsed.files))
+            self._loop.run_until_complete(self._handle_message(parsed.message, parsed.files))
         elif parsed.type == "empty":
             pass
     
@@ -274,13 +641,21 @@ class CLI:
         
         Requirements: 1.3 - Update status bar when provider or mode changes
         """
-        result = self._commands.execute(
-            command,
-            args,
-            session=self._sessions.current_session,
-            config=self._config,
-            renderer=self._renderer
-        )
+        context = {
+            "session": self._sessions.current_session,
+            "config": self._config,
+            "renderer": self._renderer,
+        }
+        if isinstance(self._commands.get(command), AsyncSlashCommand):
+            # Run on the CLI's loop; AsyncSlashCommand.run would create a
+            # throwaway loop and leave no current loop behind
+            result = self._loop.run_until_complete(
+                self._commands.execute_async(command, args, **context)
+            )
+        else:
+            result = self._commands.execute(command, args, **context)
+        # Commands may switch provider, model, mode or session
+        self._status_dirty = True
         
         if result.should_exit:
             self._running = False
@@ -295,18 +670,31 @@ class CLI:
         if result.message:
             if result.is_error:
                 self._renderer.print_error(result.message)
-            else:
+            elif _MARKDOWN_SYNTAX_RE.search(result.message):
                 self._renderer.print_markdown(result.message)
+            else:
+                # Plain one-line messages look the same without the Markdown parser
+                self._renderer.print(
+                    result.message, markup=False, highlight=False, emoji=False
+                )
         
         # Update status bar after command execution (mode/provider may have changed)
         # Requirements: 1.3 - Immediately update when provider or mode changes
         self._update_status_bar()
     
-    def _update_status_bar(self) -> None:
+    def _update_status_bar(self, mode_config: Optional[ModeConfig] = None) -> None:
         """Update the status bar with current session state.
         
+        Args:
+            mode_config: The current mode, if already resolved by the caller.
+        
         Requirements: 1.1, 1.3, 1.4 - Status bar updates
         """
+        # Nothing that feeds the status bar changed since the last update
+        if not self._status_dirty:
+            return
+        self._status_dirty = False
+        
         session = self._sessions.current_session
         
         # Get session name and branch
@@ -314,36 +702,36 @@ class CLI:
         branch = "main"
         if session:
             session_name = getattr(session, 'name', 'new') or 'new'
-            # Try to get git branch
-            try:
-                git_dir = os.path.join(os.getcwd(), '.git')
-                if os.path.isdir(git_dir):
-                    head_file = os.path.join(git_dir, 'HEAD')
-                    if os.path.isfile(head_file):
-                        with open(head_file, 'r') as f:
-                            ref = f.read().strip()
-                            if ref.startswith('ref: refs/heads/'):
-                                branch = ref[16:]
-            except Exception:
-                pass
+            branch = self._get_git_branch()
         
         # Get mode info
-        mode_slug = self.current_mode
-        mode_config = self._prompt_builder.mode_manager.get(mode_slug)
+        if mode_config is None:
+            mode_config = self._prompt_builder.mode_manager.get(self.current_mode)
         
         # Get provider info
-        provider = self._config.llm.provider
-        model = self._config.llm.model
-        free_providers = ["qwen", "gemini", "ollama"]
-        is_free = provider in free_providers
+        llm = self._config.llm
+        provider = llm.provider
+        model = llm.model
+        is_free = provider in _FREE_PROVIDERS
         
         # Calculate context percentage using ContextCalculator
         # Requirements: 2.1, 2.2, 2.3, 2.4 - Consistent context percentage calculation
         context_percent = 0
         if session:
-            messages = session.get_context() if hasattr(session, 'get_context') else []
-            max_tokens = self._config.llm.max_tokens or 4096
-            context_percent = self._context_calculator.calculate_percentage(messages, max_tokens)
+            max_tokens = llm.max_tokens or 4096
+            cache_key = (
+                getattr(session, 'id', None),
+                getattr(session, 'updated_at', None),
+                len(getattr(session, 'messages', ())),
+                max_tokens,
+            )
+            cached = self._context_percent_cache
+            if cached is not None and cached[0] == cache_key:
+                context_percent = cached[1]
+            else:
+                messages = session.get_context() if hasattr(session, 'get_context') else []
+                context_percent = self._context_calculator.calculate_percentage(messages, max_tokens)
+                self._context_percent_cache = (cache_key, context_percent)
         
         # Update status bar
         self._status_bar.update(
@@ -357,102 +745,130 @@ class CLI:
             context_percent=context_percent
         )
     
-    def _get_prompt(self) -> str:
+    def _get_cwd(self) -> str:
+        """Get the current working directory, re-reading it only when dirty.
+        
+        Returns:
+            The process working directory.
+        """
+        if self._cwd_dirty:
+            self._cwd = os.getcwd()
+            self._cwd_dirty = False
+        return self._cwd
+    
+    def _get_git_branch(self) -> str:
+        """Get the git branch of the current directory for the status bar.
+        
+        The parsed branch is cached per directory and keyed on the mtime of
+        .git/HEAD, so the file is only re-read after a commit or checkout.
+        
+        Returns:
+            The current branch name, or "main" if it cannot be determined.
+        """
+        cwd = self._get_cwd()
+        try:
+            mtime = os.stat(os.path.join(cwd, '.git', 'HEAD')).st_mtime_ns
+        except OSError:
+            mtime = 0
+        
+        cached = self._branch_cache.get(cwd)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        branch = "main"
+        if mtime:
+            try:
+                with open(os.path.join(cwd, '.git', 'HEAD'), 'r') as f:
+                    ref = f.read().strip()
+                    if ref.startswith(_HEAD_REF_PREFIX):
+                        branch = ref.removeprefix(_HEAD_REF_PREFIX)
+            except OSError:
+                pass
+        
+        self._branch_cache[cwd] = (mtime, branch)
+        return branch
+    
+    def _get_prompt(self, mode_config: Optional[ModeConfig] = None) -> str:
         """Get the input prompt string with model info and current mode.
         
+        Args:
+            mode_config: The current mode, if already resolved by the caller.
+        
         Requirements: 9.2 - Compact mode support for narrow terminals
         """
-        cwd = os.getcwd()
-        # Show shortened path in prompt
-        home = os.path.expanduser('~')
-        if cwd.startswith(home):
-            short_path = '~' + cwd[len(home):].replace('\\', '/')
-        else:
-            short_path = cwd.replace('\\', '/')
-        # Keep only last 2 parts if path is long
-        parts = short_path.split('/')
-        if len(parts) > 3:
-            short_path = '.../' + '/'.join(parts[-2:])
-        
-        # In compact mode, use even shorter path
-        if self._layout_manager.is_compact_mode and len(short_path) > 20:
-            short_path = self._layout_manager.truncate_text(short_path, 20)
+        cwd = self._get_cwd()
+        is_compact = self._layout_manager.is_compact_mode
+        
+        # The shortened path only changes with cwd or layout mode, so reuse it
+        path_cache = self._prompt_path_cache
+        short_path = path_cache.get((cwd, is_compact))
+        if short_path is None:
+            # Show shortened path in prompt
+            home = self._home
+            short_path = '~' + cwd[len(home):] if cwd.startswith(home) else cwd
+            if _BACKSLASH_SEP:
+                short_path = short_path.replace('\\', '/')
+            # Keep only last 2 parts if path is long
+            parts = short_path.split('/')
+            if len(parts) > 3:
+                short_path = '.../' + '/'.join(parts[-2:])
+            
+            # In compact mode, use even shorter path
+            if is_compact and len(short_path) > 20:
+                short_path = self._layout_manager.truncate_text(short_path, 20)
+            
+            if len(path_cache) >= _PROMPT_PATH_CACHE_SIZE:
+                # Evict the oldest entry
+                del path_cache[next(iter(path_cache))]
+            path_cache[(cwd, is_compact)] = short_path
         
         # Print model info above prompt with current mode
-        provider = self._config.llm.provider.capitalize()
-        model = self._config.llm.model
-        # Only show Free for OAuth providers
-        free_providers = ["qwen", "gemini", "ollama"]
+        llm = self._config.llm
+        provider = llm.provider.capitalize()
+        model = llm.model
         # Get current mode info
-        mode_slug = self.current_mode
-        mode_config = self._prompt_builder.mode_manager.get(mode_slug)
+        if mode_config is None:
+            mode_config = self._prompt_builder.mode_manager.get(self.current_mode)
         
         # Get context percentage for display
         context_percent = self._status_bar.data.context_percent
-        context_display = f" [rgb(138,43,226)]/[/rgb(138,43,226)] [rgb(138,43,226)]{context_percent}%[/rgb(138,43,226)]"
         
         # In compact mode, show abbreviated info
-        if self._layout_manager.is_compact_mode:
+        if is_compact:
             # Abbreviated display for narrow terminals
-            mode_display = f" [rgb(138,43,226)]/[/rgb(138,43,226)] [rgb(138,43,226)]{mode_config.icon}[/rgb(138,43,226)]"
-            self._renderer.print(f"[cyan]{provider[:4]}[/cyan] [rgb(138,43,226)]/[/rgb(138,43,226)] [rgb(138,43,226)]{model[:10]}[/rgb(138,43,226)]{mode_display}{context_display}")
+            self._renderer.print(_PROMPT_INFO_TEMPLATE.format(
+                provider=provider[:4],
+                model=model[:10],
+                mode=mode_config.icon,
+                context=context_percent,
+            ))
         else:
-            mode_display = f" [rgb(138,43,226)]/[/rgb(138,43,226)] [rgb(138,43,226)]{mode_config.icon} {mode_config.name}[/rgb(138,43,226)]"
-            self._renderer.print(f"[cyan]{provider}[/cyan] [rgb(138,43,226)]/[/rgb(138,43,226)] [rgb(138,43,226)]{model}[/rgb(138,43,226)]{mode_display}{context_display}")
+            self._renderer.print(_PROMPT_INFO_TEMPLATE.format(
+                provider=provider,
+                model=model,
+                mode=f"{mode_config.icon} {mode_config.name}",
+                context=context_percent,
+            ))
         
         # Return HTML-formatted prompt for prompt_toolkit styling
-        from prompt_toolkit.formatted_text import HTML
         return HTML(f'<path>[{short_path}] &gt; </path>')
     
     def _ensure_session(self) -> None:
         """Ensure there's an active session."""
         if not self._sessions.current_session:
+            llm = self._config.llm
             self._sessions.create_session(
-                provider=self._config.llm.provider,
-                model=self._config.llm.model,
-                system_prompt=self._config.llm.system_prompt
+                provider=llm.provider,
+                model=llm.model,
+                system_prompt=llm.system_prompt
             )
-    
-    async def _process_input(self, user_input: str) -> None:
-        """Process user input."""
-        parsed = self._parser.parse(user_input)
-        
-        if parsed.type == "command":
-            await self._handle_command(parsed.command, parsed.args)
-        elif parsed.type == "shell":
-            await self._handle_shell(parsed.shell_command)
-        elif parsed.type == "message":
-            await self._handle_message(parsed.message, parsed.files)
-        elif parsed.type == "empty":
-            pass
-    
-    async def _handle_command(self, command: str, args: str) -> None:
-        """Handle a slash command."""
-        result = await self._commands.execute_async(
-            command,
-            args,
-            session=self._sessions.current_session,
-            config=self._config,
-            renderer=self._renderer
-        )
-        
-        if result.should_exit:
-            self._running = False
-        
-        if result.should_clear:
-            self._renderer.clear()
-            self._renderer.print_welcome()
-            return
-        
-        if result.message:
-            if result.is_error:
-                self._renderer.print_error(result.message)
-            else:
-                self._renderer.print_markdown(result.message)
+            self._status_dirty = True
     
     async def _handle_shell(self, command: str) -> None:
         """Handle a shell command."""
         self._renderer.print(f"[dim]$ {command}[/dim]")
+        # Shell commands can switch git branches
+        self._status_dirty = True
         
         result = await self._bash.run_async(command)
         
@@ -465,7 +881,14 @@ class CLI:
     async def _handle_message(self, message: str, files: list) -> None:
         """Handle a chat message."""
         if files:
-            loaded_files = self._files.load_multiple(files)
+            # Read attachments in worker threads, keeping the loop free
+            semaphore = asyncio.Semaphore(_FILE_LOAD_CONCURRENCY)
+            
+            async def load(path: str):
+                async with semaphore:
+                    return await asyncio.to_thread(self._files.load, path)
+            
+            loaded_files = await asyncio.gather(*(load(path) for path in files))
             file_contents = []
             
             for f in loaded_files:
@@ -475,7 +898,7 @@ class CLI:
                     self._renderer.print_warning(f.error or f"Failed to load {f.path}")
             
             if file_contents:
-                message = message + "\n\n" + "\n\n".join(file_contents)
+                message = "\n\n".join([message, *file_contents])
         
         session = self._sessions.current_session
         if not session:
@@ -483,6 +906,7 @@ class CLI:
             session = self._sessions.current_session
         
         session.add_message("user", message)
+        self._status_dirty = True
         self._renderer.print_message(message, role="user")
         
         # Detect if this is a project analysis request
@@ -493,7 +917,8 @@ class CLI:
         # Detect if this is a file creation request
         # Requirements: 2.1 - Detect "create file/project" type requests
         file_creation_enforcer = get_file_creation_enforcer()
-        file_creation_enforcer.working_dir = os.getcwd()
+        cwd = os.getcwd()
+        file_creation_enforcer.working_dir = cwd
         file_creation_enforcer.start_session()
         creation_request = file_creation_enforcer.is_creation_request(message)
         
@@ -501,23 +926,23 @@ class CLI:
         # Requirements: 2.4 - Track created files for confirmation display
         self._tool_action_mapper.file_creation_enforcer = file_creation_enforcer
         
+        llm = self._config.llm
         try:
-            provider = self._providers.get(self._config.llm.provider)
+            provider = self._providers.get(llm.provider)
             if not provider:
-                self._renderer.print_error(f"Provider not found: {self._config.llm.provider}")
+                self._renderer.print_error(f"Provider not found: {llm.provider}")
                 return
             
             # Providers that don't require API key (local or OAuth-based)
-            no_key_providers = ["ollama", "gemini", "qwen"]
-            if not provider.api_key and self._config.llm.provider not in no_key_providers:
+            if not provider.api_key and llm.provider not in _NO_KEY_PROVIDERS:
                 self._renderer.print_error(
-                    f"No API key set for {self._config.llm.provider}. "
+                    f"No API key set for {llm.provider}. "
                     f"Set environment variable or use /settings."
                 )
                 return
             
             # Update tool executor working directory
-            self._tools.working_dir = os.getcwd()
+            self._tools.working_dir = cwd
             
             # Start session tracking for status footer
             # Requirements: 8.1 - Add status footer rendering after response completion
@@ -528,16 +953,11 @@ class CLI:
             self._session_tool_calls: list[str] = []
             
             # Build context with system message including current directory
-            context = self._build_context_with_tools(session)
-            
-            # Determine if provider is free-tier for status footer
-            free_providers = ["qwen", "gemini", "ollama"]
-            is_free_tier = self._config.llm.provider in free_providers
+            context = self._build_context_with_tools(session, cwd)
             
             # Providers without native tool support - use simple streaming
             # Note: Gemini supports native tool calling via functionCall, so it uses _get_response_with_tools
-            no_tool_providers = ["qwen", "groq"]
-            if self._config.llm.provider in no_tool_providers:
+            if llm.provider in _NO_TOOL_PROVIDERS:
                 await self._get_streaming_response(provider, context, session)
             else:
                 await self._get_response_with_tools(provider, context, session)
@@ -582,13 +1002,14 @@ class CLI:
             
             # Update status bar after response (context may have changed)
             # Requirements: 1.4 - Update context percentage in real-time
+            self._status_dirty = True
             self._update_status_bar()
                 
         except Exception as e:
             error_msg = str(e) if str(e) else f"{type(e).__name__}: {repr(e)}"
             self._renderer.print_error(f"LLM Error: {error_msg}")
     
-    def _build_context_with_tools(self, session) -> list:
+    def _build_context_with_tools(self, session, cwd: Optional[str] = None) -> list:
         """Build message context with system prompt using the new PromptBuilder.
         
         Uses the modular prompt system to generate the system prompt based on
@@ -596,6 +1017,7 @@ class CLI:
         
         Args:
             session: The current session containing conversation history.
+            cwd: The working directory, if the caller has already read it.
             
         Returns:
             List of messages with system prompt prepended.
@@ -603,19 +1025,34 @@ class CLI:
         # Get mode from session metadata or use default
         mode = self._get_session_mode(session)
         
-        # Build prompt configuration
-        config = PromptConfig(
-            mode=mode,
-            include_tools=True,
-            include_mcp=self._config.mcp.enabled,
-        )
+        include_mcp = self._config.mcp.enabled
+        
+        # The prompt only depends on the mode, the working directory (for
+        # environment and rules), the rule files and the tool set, so reuse
+        # it across messages until one of those changes
+        if cwd is None:
+            cwd = os.getcwd()
+        rules_signature = self._prompt_builder.rules_loader.signature(Path(cwd))
+        tools_version = self._prompt_builder.tool_catalog.version
+        cache_key = (mode, cwd, rules_signature, include_mcp, tools_version)
+        system_prompt = self._system_prompt_cache.get(cache_key)
+        if system_prompt is None:
+            config = PromptConfig(
+                mode=mode,
+                include_tools=True,
+                include_mcp=include_mcp,
+            )
+            system_prompt = self._prompt_builder.build(config)
+            self._system_prompt_cache[cache_key] = system_prompt
         
         # Get conversation history (excluding system messages)
-        context = session.get_context()
-        conversation = [msg for msg in context if msg.get("role") != "system"]
+        get_conversation = getattr(session, "get_conversation", None)
+        if get_conversation is not None:
+            conversation = get_conversation()
+        else:
+            conversation = [msg for msg in session.get_context() if msg.get("role") != "system"]
         
-        # Use PromptBuilder to generate messages with system prompt
-        return self._prompt_builder.build_messages(config, conversation)
+        return [{"role": "system", "content": system_prompt}, *conversation]
     
     def _get_session_mode(self, session) -> str:
         """Get the current mode from session metadata.
@@ -643,6 +1080,7 @@ class CLI:
             session.metadata["mode"] = mode
             self._sessions.save_session(session)
         self._current_mode = mode
+        self._status_dirty = True
     
     @property
     def current_mode(self) -> str:
@@ -657,8 +1095,11 @@ class CLI:
         Args:
             mode: The mode slug to switch to.
         """
-        # Validate mode exists (will fall back to default if not found)
-        self._prompt_builder.mode_manager.get(mode)
+        # Validate mode exists; get() logs the fallback to the default mode
+        # (or raises if no default is registered) for unknown slugs
+        mode_manager = self._prompt_builder.mode_manager
+        if mode not in mode_manager:
+            mode_manager.get(mode)
         session = self._sessions.current_session
         self._set_session_mode(session, mode)
     
@@ -693,40 +1134,40 @@ class CLI:
     
     async def _stream_response(self, provider, context: list, session) -> None:
         """Stream response from LLM with live reasoning display."""
+        llm = self._config.llm
         self._renderer.start_spinner("Thinking...")
         
-        # Initialize streaming progress indicator for extended silence detection
+        # Reuse the streaming progress indicator; start() resets its timing state
         # Requirements: 5.1, 5.4 - Show "still thinking" indicator for extended silence
-        progress_config = StreamingProgressConfig(
-            thinking_timeout_seconds=5.0,
-            show_cancel_hint=True
-        )
-        progress_indicator = StreamingProgressIndicator(
-            self._renderer.console,
-            config=progress_config
-        )
+        progress_indicator = self._progress_indicator
         
         try:
             first_chunk = True
             self._renderer.start_live_reasoning()
             progress_indicator.start()
             
+            # Batch chunks so the live display re-renders per batch, not per token;
+            # the renderer accumulates the text, so nothing is concatenated here
+            coalescer = _StreamCoalescer(self._renderer.update_live_stream)
+            
             async for chunk in provider.chat_stream(
                 messages=context,
-                model=self._config.llm.model,
-                temperature=self._config.llm.temperature,
-                max_tokens=self._config.llm.max_tokens
+                model=llm.model,
+                temperature=llm.temperature,
+                max_tokens=llm.max_tokens
             ):
                 if first_chunk:
                     self._renderer.stop_spinner()
                     first_chunk = False
                 
-                # Update live display with chunk
-                self._renderer.update_live_stream(chunk.content)
+                coalescer.add(chunk.content)
                 # Record content arrival to reset timeout timer
                 # Requirements: 5.4 - Track content arrival for timeout detection
                 progress_indicator.on_content_received()
             
+            # Flush whatever is left before the live display is torn down
+            coalescer.flush()
+            
             # Stop live stream and get final content
             progress_indicator.stop()
             response_content, reasoning_content = self._renderer.stop_live_stream()
@@ -740,10 +1181,9 @@ class CLI:
                 self._renderer.print_message(response_content, role="assistant")
             
             # Save to session
-            full_response = response_content
-            if full_response:
-                tokens = len(full_response) // 4
-                session.add_message("assistant", full_response, tokens=tokens)
+            if response_content:
+                tokens = count_tokens(response_content)
+                session.add_message("assistant", response_content, tokens=tokens)
                 self._sessions.save_session(session)
                 
         finally:
@@ -752,14 +1192,15 @@ class CLI:
     
     async def _get_response(self, provider, context: list, session) -> None:
         """Get complete response from LLM."""
+        llm = self._config.llm
         live = self._renderer.start_spinner("Thinking...")
         
         try:
             response = await provider.chat(
                 messages=context,
-                model=self._config.llm.model,
-                temperature=self._config.llm.temperature,
-                max_tokens=self._config.llm.max_tokens
+                model=llm.model,
+                temperature=llm.temperature,
+                max_tokens=llm.max_tokens
             )
             
             self._renderer.stop_spinner()
@@ -803,10 +1244,10 @@ class CLI:
         
         Requirements: 1.1, 1.2, 1.3, 1.4, 3.1, 3.2, 3.3, 4.1, 4.2, 4.3, 4.4, 5.2
         """
-        import re
-        from .io_handlers import ChunkDeduplicator
-        
-        messages = context.copy()
+        llm = self._config.llm
+        # _build_context_with_tools returns a fresh list per message, so the
+        # follow-up turns below can be appended to it in place
+        messages = context
         
         # Initialize new components for completion detection and loop management
         # Requirements: 1.1, 1.2, 1.3 - Completion detection
@@ -820,11 +1261,6 @@ class CLI:
         # Requirements: 5.2 - Display content incrementally without duplication
         chunk_deduplicator = ChunkDeduplicator()
         
-        # Initialize the tool parser with registered format parsers
-        tool_parser = ToolParser()
-        tool_parser.register(PythonStyleParser())
-        tool_parser.register(XMLStyleParser())
-        
         # Track executed tool calls to prevent duplicates
         executed_calls: set[str] = set()
         
@@ -842,42 +1278,67 @@ class CLI:
                 self._renderer.print_warning(warning_msg)
                 break
             
-            # Accumulate raw response without live display to avoid duplication
-            raw_response = ""
+            # Accumulate raw response without live display to avoid duplication;
+            # chunks are joined once the stream ends
+            chunks: list[str] = []
             self._renderer.start_spinner("Thinking...")
             
-            # Initialize streaming progress indicator for extended silence detection
+            # Reuse the streaming progress indicator; start() resets its timing state
             # Requirements: 5.1, 5.4 - Show "still thinking" indicator for extended silence
-            progress_config = StreamingProgressConfig(
-                thinking_timeout_seconds=5.0,
-                show_cancel_hint=True
-            )
-            progress_indicator = StreamingProgressIndicator(
-                self._renderer.console,
-                config=progress_config
-            )
+            progress_indicator = self._progress_indicator
             progress_indicator.start()
             
+            # Read-only tool calls started while the response is still streaming.
+            # Chunks from scan_index on have not been scanned for them yet,
+            # carry is scanned text that may still hold the start of a call,
+            # and pending is the length of both together
+            prefetched: dict[str, asyncio.Future] = {}
+            carry = ""
+            scan_index = 0
+            pending = 0
+            rescan_at = 0
+            
             try:
-                async for chunk in provider.chat_stream(
+                # The provider is read ahead so network waits overlap with
+                # the per-chunk bookkeeping and tool prefetching below
+                async for chunk in _read_ahead(provider.chat_stream(
                     messages=messages,
-                    model=self._config.llm.model,
-                    temperature=self._config.llm.temperature,
-                    max_tokens=self._config.llm.max_tokens
-                ):
-                    raw_response += chunk.content
+                    model=llm.model,
+                    temperature=llm.temperature,
+                    max_tokens=llm.max_tokens
+                )):
+                    chunks.append(chunk.content)
                     # Record content arrival to reset timeout timer
                     # Requirements: 5.4 - Track content arrival for timeout detection
                     progress_indicator.on_content_received()
+                    
+                    pending += len(chunk.content)
+                    # A call can only have completed if this chunk closed something
+                    if pending >= rescan_at and (
+                        ")" in chunk.content or ">" in chunk.content
+                    ):
+                        text = carry + "".join(chunks[scan_index:])
+                        scan_index = len(chunks)
+                        consumed, incomplete = self._prefetch_tool_calls(
+                            text, executed_calls, prefetched
+                        )
+                        carry = text[consumed:]
+                        pending = len(carry)
+                        # An unfinished call is re-parsed from its start, so
+                        # wait for the text to double before trying again
+                        rescan_at = 2 * pending if incomplete else 0
             except Exception as e:
                 self._renderer.stop_spinner()
                 progress_indicator.stop()
                 self._renderer.print_error(f"LLM Error: {e}")
+                await self._settle_prefetched(prefetched)
                 return
             finally:
                 self._renderer.stop_spinner()
                 progress_indicator.stop()
             
+            raw_response = "".join(chunks)
+            
             # Check for empty response using ResponseValidator
             # Requirements: 3.1, 3.2, 3.3 - Handle empty responses with retry
             retry_decision = response_validator.should_retry(raw_response, retry_count)
@@ -892,82 +1353,30 @@ class CLI:
                     self._renderer.print_warning("Model returned empty response. Try again.")
                 return
             
-            # Parse think tags from raw response
-            from .rich_ui.content_parser import parse_think_tags
-            parsed = parse_think_tags(raw_response)
-            response_content = parsed.response
-            reasoning_content = parsed.reasoning
+            # Think-tag parsing, tool parsing and scrubbing are CPU-bound, so run
+            # them off the event loop
+            content, reasoning_content, display_content, parsed_calls = await asyncio.to_thread(
+                self._postprocess_turn, raw_response, chunk_deduplicator
+            )
             
             # Display reasoning content if present (before tool execution)
             # Requirements: 5.1 - Display reasoning in yellow panel
             if reasoning_content and reasoning_content.strip():
                 self._renderer.print_reasoning(reasoning_content)
             
-            # Parse tool calls using the modular ToolParser
-            # Check both response content AND reasoning content (model sometimes puts tools in thinking)
-            content = response_content or ""
-            all_content = content + "\n" + (reasoning_content or "")
-            parsed_calls = tool_parser.parse(all_content)
-            
             # Filter out duplicate tool calls (same tool + same args)
             unique_calls = []
             for call in parsed_calls:
-                call_key = f"{call.name}:{str(sorted(call.arguments.items()))}"
+                call_key = call.dedup_key
                 if call_key not in executed_calls:
                     unique_calls.append(call)
                     executed_calls.add(call_key)
             
-            # Strip tool call syntax from displayed content
-            # Remove XML-style: <tool_name(args)>...</tool_name> and <tool_name(args)>
-            display_content = re.sub(r'<\w+\([^)]*\)>[^<]*</\w+>', '', content)
-            display_content = re.sub(r'<\w+\([^)]*\)>', '', display_content)
-            # Remove Python-style: tool_name(args) - including inside code blocks
-            display_content = re.sub(r'\b(read_file|write_file|list_directory|create_directory|run_command|get_current_directory)\s*\([^)]*\)', '', display_content)
-            # Remove malformed XML closing tags (Qwen outputs these)
-            display_content = re.sub(r'<\s*/\s*(read_file|write_file|list_directory|create_directory|run_command|get_current_directory)\s*>', '', display_content)
-            # Remove standalone closing/opening tags
-            display_content = re.sub(r'</(read_file|write_file|list_directory|create_directory|run_command|get_current_directory)>', '', display_content)
-            display_content = re.sub(r'<(read_file|write_file|list_directory|create_directory|run_command|get_current_directory)>', '', display_content)
-            # Remove empty code blocks that contained only tool calls
-            display_content = re.sub(r'```\s*```', '', display_content)
-            display_content = re.sub(r'```\s*\n?\s*```', '', display_content)
-            # Remove lines that are just "< " artifacts
-            display_content = re.sub(r'^\s*<\s*$', '', display_content, flags=re.MULTILINE)
-            # Remove "python" artifacts from tool call parsing
-            display_content = re.sub(r'\bpython\b(?=\s*python|\s*$)', '', display_content)
-            # Remove Rich panel border characters that model might output
-            display_content = re.sub(r'[┏┓┗┛┃━]+', '', display_content)
-            display_content = display_content.strip()
-            
-            # Deduplicate repeated content using ChunkDeduplicator
-            # Requirements: 5.2 - Display content incrementally without duplication
-            # Handles both paragraph-level and line-level deduplication
-            display_content = chunk_deduplicator.deduplicate_content(display_content)
-            
             # Execute parsed tool calls FIRST with consistent visual feedback
-            tool_results = []
-            num_calls = len(unique_calls)
-            
-            # Add visual header if multiple tool calls
-            # Requirements: 4.3 - Show progress for multi-tool sequences
-            if num_calls > 1:
-                self._renderer.print_tool_section_header(num_calls)
-            
-            for i, call in enumerate(unique_calls):
-                # Show progress for multi-tool sequences
-                # Requirements: 4.3 - Show progress indicator for multi-tool sequences
-                if num_calls > 1:
-                    self._renderer.print_tool_progress(i + 1, num_calls, call.name)
-                
-                result_str = self._execute_tool_call(call)
-                tool_results.append(result_str)
-                
-                # Add visual separator between multiple tool calls
-                if num_calls > 1 and i < num_calls - 1:
-                    self._renderer.print_tool_separator()
+            tool_results = await self._execute_tool_calls(unique_calls, prefetched)
             
             # Filter out invalid tool calls (tools that returned errors)
-            valid_results = [r for r in tool_results if "Error: Unknown tool" not in r]
+            valid_results = [r.text for r in tool_results if not r.is_unknown_tool]
             
             if valid_results:
                 messages.append({"role": "assistant", "content": content})
@@ -979,36 +1388,17 @@ class CLI:
             
             # No valid tool calls - check if we have a response to show
             # Clean any remaining think tags and tool syntax from response
-            final_content = display_content if display_content else ""
-            final_content = re.sub(r'</?think>?', '', final_content).strip()
-            # Also clean any remaining tool-like patterns
-            final_content = re.sub(r'<[^>]*\([^)]*\)[^>]*>', '', final_content).strip()
-            # Clean malformed closing tags
-            final_content = re.sub(r'<\s*/\s*\w+\s*>', '', final_content).strip()
-            final_content = re.sub(r'^\s*<\s*$', '', final_content, flags=re.MULTILINE).strip()
+            final_content = _clean_final_content(display_content or "")
             
             # If response is empty but we have reasoning, use reasoning as the response
             # (Qwen sometimes puts the actual response in reasoning_content)
             # But only if reasoning wasn't already printed during streaming
             if not final_content and reasoning_content and not self._renderer.was_reasoning_printed():
-                final_content = reasoning_content.strip()
-                final_content = re.sub(r'</?think>?', '', final_content).strip()
-                final_content = re.sub(r'<[^>]*\([^)]*\)[^>]*>', '', final_content).strip()
-                final_content = re.sub(r'<\s*/\s*\w+\s*>', '', final_content).strip()
-                final_content = re.sub(r'^\s*<\s*$', '', final_content, flags=re.MULTILINE).strip()
+                final_content = _clean_final_content(reasoning_content)
             
             # Check for empty or useless responses (just punctuation, filenames only, etc.)
             # Note: Don't filter short responses - simple greetings like "hi" are valid
-            stripped_content = final_content.strip() if final_content else ""
-            is_useless_response = (
-                not final_content or 
-                len(stripped_content) < 2 or  # Only filter truly empty responses
-                re.match(r'^[\s\.\,\!\?\-\_\*]+$', stripped_content) or
-                # Just a filename or path (no actual content)
-                re.match(r'^[\w\-\_\.\/\\]+\.(py|txt|md|json|toml|yaml|yml|js|ts|html|css)$', stripped_content, re.IGNORECASE) or
-                # Just a single word or identifier
-                re.match(r'^\w+$', stripped_content)
-            )
+            is_useless_response = _is_useless_response(final_content)
             
             # If still no useful content after tool calls, prompt for a real response
             # Requirements: 3.1, 3.2 - Use ResponseValidator for empty/substantive checks
@@ -1035,6 +1425,8 @@ class CLI:
             
             # Use CompletionDetector to check for completion status
             # Requirements: 1.1, 1.2, 1.3 - Completion detection using new component
+            # No separate fast path is needed after tool calls: is_complete returns
+            # before its phrase checks when tool_calls_made is set
             tool_calls_made = bool(tool_results)
             completion_result = completion_detector.is_complete(final_content, tool_calls_made)
             
@@ -1060,18 +1452,273 @@ class CLI:
             if final_content and not tool_results:
                 # Get list of tools that were actually called
                 tools_called = [call.name for call in unique_calls] if unique_calls else []
-                skipped_detections = detect_skipped_tools(final_content, tools_called)
-                
-                for detection in skipped_detections:
-                    if detection.detected and detection.confidence >= 0.6:
-                        self._renderer.print_tool_warning(
-                            message="The assistant described an action but did not execute it.",
-                            suggested_tool=detection.suggested_tool,
-                            detected_action=detection.action_description
-                        )
+                # One warning is enough, so stop scanning at the first hit
+                detection = await asyncio.to_thread(
+                    find_skipped_tool, final_content, tools_called, 0.6
+                )
+                if detection is not None:
+                    self._renderer.print_tool_warning(
+                        message="The assistant described an action but did not execute it.",
+                        suggested_tool=detection.suggested_tool,
+                        detected_action=detection.action_description
+                    )
             break
     
-    def _execute_tool_call(self, call: ParsedToolCall) -> str:
+    def _postprocess_turn(
+        self, raw_response: str, chunk_deduplicator: ChunkDeduplicator
+    ) -> Tuple[str, str, str, Tuple[ParsedToolCall, ...]]:
+        """Split, parse and scrub one raw text-parsed model turn.
+        
+        Runs in a worker thread via asyncio.to_thread; it touches no renderer
+        state, and the caller awaits it, so the deduplicator is never used
+        concurrently.
+        
+        Args:
+            raw_response: The full streamed text of the turn.
+            chunk_deduplicator: Deduplicator for repeated paragraphs and lines.
+            
+        Returns:
+            Tuple of (response content, reasoning content, display content,
+            parsed tool calls).
+        """
+        # Parse think tags and tool calls (memoized on the raw text)
+        content, reasoning_content, parsed_calls = _parse_turn(raw_response, self._tool_parser)
+        
+        # Strip tool call syntax from displayed content
+        # Tool syntax is removed first so code blocks that only held tool calls
+        # are empty by the time the artifact pass runs
+        # Every scrub pattern needs one of these; plain chat skips both passes
+        display_content = content
+        if any(sentinel in content for sentinel in _SCRUB_SENTINELS):
+            display_content = _TOOL_SYNTAX_RE.sub('', display_content)
+            display_content = _SCRUB_ARTIFACTS_RE.sub('', display_content)
+        display_content = display_content.translate(_BORDER_TRANS).strip()
+        
+        # Deduplicate repeated content using ChunkDeduplicator
+        # Requirements: 5.2 - Display content incrementally without duplication
+        # Handles both paragraph-level and line-level deduplication
+        display_content = chunk_deduplicator.deduplicate_content(display_content)
+        
+        return content, reasoning_content, display_content, parsed_calls
+    
+    def _prefetch_tool_calls(
+        self,
+        text: str,
+        skip_keys: set[str],
+        prefetched: dict[str, asyncio.Future],
+    ) -> Tuple[int, bool]:
+        """Start read-only tool calls that have fully arrived in a streaming response.
+        
+        The caller passes only text it has not scanned before and drops the
+        consumed prefix afterwards, so each call is found once. Results are
+        picked up by _execute_tool_calls after the stream ends; action cards
+        are still rendered there, in call order.
+        
+        Args:
+            text: Response text received since the last scan.
+            skip_keys: Keys of calls already executed earlier in the exchange.
+            prefetched: Running calls by key; new calls are added to it.
+            
+        Returns:
+            How many leading characters of ``text`` need no further scanning,
+            and whether the rest starts with a call that has not parsed yet.
+        """
+        match = _TOOL_CALL_START_RE.search(text)
+        if match is None:
+            # Keep a margin so a tool name split across chunks is still found
+            return max(0, len(text) - 32), False
+        
+        tail = text[match.start():]
+        calls = self._tool_parser.parse(tail)
+        if not calls:
+            return match.start(), True
+        
+        for call in calls:
+            if call.name not in _READ_ONLY_TOOLS:
+                continue
+            key = call.dedup_key
+            if key in skip_keys or key in prefetched:
+                continue
+            pre_state = {
+                "tool_name": call.name,
+                "arguments": self._normalize_tool_arguments(call.name, call.arguments),
+            }
+            prefetched[key] = asyncio.ensure_future(
+                asyncio.to_thread(self._run_tool, pre_state)
+            )
+        
+        last = calls[-1].raw_text
+        end = tail.rfind(last)
+        if end < 0:
+            return match.start(), True
+        return match.start() + end + len(last), False
+    
+    async def _settle_prefetched(self, prefetched: dict[str, asyncio.Future]) -> None:
+        """Wait for prefetched tool calls that will not be used, and forget them.
+        
+        Their threads can't be interrupted, so this keeps them from still
+        running alongside a later call with side effects.
+        """
+        if prefetched:
+            await asyncio.gather(*prefetched.values())
+            prefetched.clear()
+    
+    async def _execute_tool_calls(
+        self,
+        calls: list[ParsedToolCall],
+        prefetched: Optional[dict[str, asyncio.Future]] = None,
+    ) -> list[_ToolResult]:
+        """Execute tool calls in order with progress feedback.
+        
+        Runs of consecutive read-only calls execute concurrently in worker
+        threads; calls with side effects run one at a time, so every call
+        still sees the effects of the calls before it. Action cards and
+        progress lines are rendered in call order either way.
+        
+        Args:
+            calls: The parsed tool calls to execute.
+            prefetched: Read-only calls already started during streaming, by
+                call key. They are only reused until the first call with side
+                effects runs, since its result may depend on that call.
+            
+        Returns:
+            A _ToolResult per call, in call order.
+            
+        Requirements: 4.3 - Show progress for multi-tool sequences
+        """
+        results: list[_ToolResult] = []
+        num_calls = len(calls)
+        if prefetched is None:
+            prefetched = {}
+        
+        # Add visual header if multiple tool calls
+        if num_calls > 1:
+            self._renderer.print_tool_section_header(num_calls)
+        
+        i = 0
+        while i < num_calls:
+            # Group consecutive read-only calls into one concurrent batch
+            end = i + 1
+            if calls[i].name in _READ_ONLY_TOOLS:
+                while end < num_calls and calls[end].name in _READ_ONLY_TOOLS:
+                    end += 1
+            batch = calls[i:end]
+            
+            if calls[i].name in _READ_ONLY_TOOLS:
+                # Read-only tools render nothing before execution, so their
+                # pre-states can be captured up front
+                pre_states = [self._begin_tool_call(call) for call in batch]
+                outcomes = await asyncio.gather(*(
+                    prefetched.pop(call.dedup_key, None)
+                    or asyncio.to_thread(self._run_tool, state)
+                    for call, state in zip(batch, pre_states, strict=True)
+                ))
+            else:
+                pre_states = outcomes = (None,)
+                # Anything prefetched may now be stale
+                await self._settle_prefetched(prefetched)
+            
+            for call, pre_state, outcome in zip(batch, pre_states, outcomes, strict=True):
+                # Show progress indicator for multi-tool sequences
+                if num_calls > 1:
+                    self._renderer.print_tool_progress(i + 1, num_calls, call.name)
+                
+                if pre_state is None:
+                    results.append(self._execute_tool_call(call))
+                elif isinstance(pre_state, _ToolResult):
+                    results.append(pre_state)
+                else:
+                    results.append(self._finish_tool_call(pre_state, outcome))
+                
+                # Add visual separator between multiple tool calls
+                if num_calls > 1 and i < num_calls - 1:
+                    self._renderer.print_tool_separator()
+                i += 1
+        
+        # Calls prefetched from text the final parse didn't keep
+        await self._settle_prefetched(prefetched)
+        return results
+    
+    async def _execute_native_tool_calls(self, tool_calls: list[dict]) -> list[dict]:
+        """Execute native tool calls from an assistant message.
+        
+        Consecutive read-only calls run concurrently in worker threads; calls
+        with side effects run one at a time in order, since later calls may
+        depend on them.
+        
+        Args:
+            tool_calls: The ``tool_calls`` entries of the assistant message.
+            
+        Returns:
+            Tool-role messages with the results, in call order.
+        """
+        # Update tool action mapper working directory
+        self._tool_action_mapper.working_dir = self._tools.working_dir
+        
+        calls: list[tuple[str, str, dict]] = []
+        for tool_call in tool_calls:
+            func = tool_call.get("function", {})
+            try:
+                args = _json_loads(func.get("arguments") or "{}")
+            except json.JSONDecodeError:
+                args = {}
+            calls.append((func.get("name", ""), tool_call.get("id", ""), args))
+        
+        tool_messages: list[dict] = []
+        num_calls = len(calls)
+        i = 0
+        while i < num_calls:
+            # Group consecutive read-only calls into one concurrent batch
+            end = i + 1
+            if calls[i][0] in _READ_ONLY_TOOLS:
+                while end < num_calls and calls[end][0] in _READ_ONLY_TOOLS:
+                    end += 1
+            batch = calls[i:end]
+            
+            # Track tool calls for project analysis verification
+            # Requirements: 1.1 - Track tool calls to verify list_directory was invoked
+            if hasattr(self, '_session_tool_calls'):
+                self._session_tool_calls.extend(name for name, _, _ in batch)
+            
+            # Capture state before execution for accurate create/update detection
+            # Requirements: 8.1 - Detect file creation vs update based on file existence
+            pre_states = [
+                self._tool_action_mapper.render_tool_action_before(name, args)
+                for name, _, args in batch
+            ]
+            if len(batch) > 1:
+                outcomes = await asyncio.gather(*(
+                    asyncio.to_thread(self._run_tool, pre_state) for pre_state in pre_states
+                ))
+            else:
+                outcomes = [self._run_tool(pre_states[0])]
+            
+            for (_, tool_id, _), pre_state, outcome in zip(
+                batch, pre_states, outcomes, strict=True
+            ):
+                if isinstance(outcome, Exception):
+                    result = str(outcome)
+                    success = False
+                else:
+                    result = outcome
+                    success = not result.startswith("Error:")
+                
+                # Render action card after execution with captured state
+                # Requirements: 8.1, 8.2 - Generate appropriate action cards
+                self._tool_action_mapper.render_tool_action_after(
+                    pre_state, result=result, success=success
+                )
+                
+                tool_messages.append({
+                    "role": "tool",
+                    "tool_call_id": tool_id,
+                    "content": result or ""
+                })
+            i = end
+        
+        return tool_messages
+    
+    def _execute_tool_call(self, call: ParsedToolCall) -> _ToolResult:
         """Execute a parsed tool call with action cards visual feedback.
         
         Uses ToolActionMapper to generate action cards for tool calls,
@@ -1081,19 +1728,29 @@ class CLI:
             call: The parsed tool call to execute.
             
         Returns:
-            A string describing the result for inclusion in the conversation.
+            The tool result for inclusion in the conversation.
             
         Requirements: 8.1, 8.2 - Automatically generate action cards for tool execution
         """
+        pre_state = self._begin_tool_call(call)
+        if isinstance(pre_state, _ToolResult):
+            return pre_state
+        return self._finish_tool_call(pre_state, self._run_tool(pre_state))
+    
+    def _begin_tool_call(self, call: ParsedToolCall) -> Union[dict, _ToolResult]:
+        """Validate a tool call and capture the state needed for its action card.
+        
+        Args:
+            call: The parsed tool call about to be executed.
+            
+        Returns:
+            The pre-execution state from ToolActionMapper (holding the tool
+            name and normalized arguments), or a failed result if the tool
+            name is not a known tool.
+        """
         tool_name = call.name
         arguments = call.arguments
         
-        # Valid tool names - skip unknown tools silently to avoid noise
-        valid_tools = {
-            "read_file", "write_file", "list_directory", 
-            "create_directory", "run_command", "get_current_directory"
-        }
-        
         # Normalize arguments - handle both positional (arg0, arg1) and named arguments
         normalized_args = self._normalize_tool_arguments(tool_name, arguments)
         
@@ -1101,8 +1758,8 @@ class CLI:
         self._tool_action_mapper.working_dir = self._tools.working_dir
         
         # Skip invalid/hallucinated tool names
-        if tool_name not in valid_tools:
-            return f"Error: Unknown tool '{tool_name}'"
+        if tool_name not in _VALID_TOOLS:
+            return _ToolResult(False, True, f"Error: Unknown tool '{tool_name}'")
         
         # Track tool call for project analysis verification
         # Requirements: 1.1 - Track tool calls to verify list_directory was invoked
@@ -1111,30 +1768,55 @@ class CLI:
         
         # Capture state before execution for accurate create/update detection
         # Requirements: 8.1 - Detect file creation vs update based on file existence
-        pre_state = self._tool_action_mapper.render_tool_action_before(
+        return self._tool_action_mapper.render_tool_action_before(
             tool_name, normalized_args
         )
+    
+    def _run_tool(self, pre_state: dict) -> Union[str, Exception]:
+        """Run the tool described by a pre-execution state.
         
+        Returns:
+            The tool result, or the exception it raised.
+        """
+        if pre_state["tool_name"] not in _READ_ONLY_TOOLS:
+            # The tool may have changed rule files the system prompt includes
+            self._system_prompt_cache.clear()
         try:
-            result = self._tools.execute(tool_name, normalized_args)
-            
-            # Check if the tool executor returned an error
-            success = not result.startswith("Error:")
-            
-            # Render action card after execution with captured state
-            # Requirements: 8.1, 8.2 - Generate appropriate action cards
-            self._tool_action_mapper.render_tool_action_after(
-                pre_state, result=result, success=success
-            )
-            
-            return f"{tool_name}: {result}"
-            
+            return self._tools.execute(pre_state["tool_name"], pre_state["arguments"])
         except Exception as e:
+            return e
+    
+    def _finish_tool_call(
+        self, pre_state: dict, outcome: Union[str, Exception]
+    ) -> _ToolResult:
+        """Render the action card for a finished tool call and format its result.
+        
+        Args:
+            pre_state: The state returned by _begin_tool_call.
+            outcome: The tool result, or the exception it raised.
+            
+        Returns:
+            The tool result for inclusion in the conversation.
+        """
+        tool_name = pre_state["tool_name"]
+        
+        if isinstance(outcome, Exception):
             # Render action card for failed execution
             self._tool_action_mapper.render_tool_action_after(
-                pre_state, result=str(e), success=False
+                pre_state, result=str(outcome), success=False
             )
-            return f"{tool_name} error: {e}"
+            return _ToolResult(False, False, f"{tool_name} error: {outcome}")
+        
+        # Check if the tool executor returned an error
+        success = not outcome.startswith("Error:")
+        
+        # Render action card after execution with captured state
+        # Requirements: 8.1, 8.2 - Generate appropriate action cards
+        self._tool_action_mapper.render_tool_action_after(
+            pre_state, result=outcome, success=success
+        )
+        
+        return _ToolResult(success, False, f"{tool_name}: {outcome}")
     
     def _normalize_tool_arguments(self, tool_name: str, arguments: dict) -> dict:
         """Normalize tool arguments from positional to named format.
@@ -1149,27 +1831,21 @@ class CLI:
         Returns:
             Normalized arguments dictionary with proper parameter names.
         """
+        # Copy over any already-named arguments, noting whether positional ones exist
+        normalized = {}
+        has_positional = False
+        for key, value in arguments.items():
+            if key.startswith('arg') and key[3:].isdigit():
+                has_positional = True
+            else:
+                normalized[key] = value
+        
         # If arguments already have proper names, return as-is
-        if not any(key.startswith('arg') and key[3:].isdigit() for key in arguments):
+        if not has_positional:
             return arguments
         
         # Map positional arguments to named parameters based on tool
-        param_mappings = {
-            "read_file": ["path"],
-            "write_file": ["path", "content"],
-            "list_directory": ["path"],
-            "create_directory": ["path"],
-            "run_command": ["command"],
-            "get_current_directory": [],
-        }
-        
-        param_names = param_mappings.get(tool_name, [])
-        normalized = {}
-        
-        # Copy over any already-named arguments
-        for key, value in arguments.items():
-            if not (key.startswith('arg') and key[3:].isdigit()):
-                normalized[key] = value
+        param_names = _PARAM_MAPPINGS.get(tool_name, ())
         
         # Map positional arguments to named parameters
         for i, param_name in enumerate(param_names):
@@ -1197,7 +1873,7 @@ class CLI:
         elif "command" in arguments:
             cmd = arguments['command']
             if len(cmd) > 50:
-                cmd = cmd[:47] + "..."
+                cmd = f"{cmd[:47]}..."
             return f": {cmd}"
         
         # For other arguments, show a brief summary
@@ -1205,7 +1881,7 @@ class CLI:
         for key, value in list(arguments.items())[:2]:
             str_val = str(value)
             if len(str_val) > 30:
-                str_val = str_val[:27] + "..."
+                str_val = f"{str_val[:27]}..."
             preview_parts.append(f"{key}={str_val}")
         
         if preview_parts:
@@ -1224,7 +1900,7 @@ class CLI:
         """
         if len(result) <= max_length:
             return result
-        return result[:max_length] + "..."
+        return f"{result[:max_length]}..."
     
     async def _get_response_with_tools(self, provider, context: list, session, max_iterations: int = 10) -> None:
         """Get response from LLM with tool calling support and streaming reasoning.
@@ -1234,7 +1910,10 @@ class CLI:
         
         Requirements: 1.1, 1.2, 1.3, 1.4, 3.1, 3.2, 3.3, 4.1, 4.2, 4.3, 4.4
         """
-        messages = context.copy()
+        llm = self._config.llm
+        # _build_context_with_tools returns a fresh list per message, so tool
+        # calls and results below can be appended to it in place
+        messages = context
         
         # Initialize new components for completion detection and loop management
         # Requirements: 1.1, 1.2, 1.3 - Completion detection
@@ -1250,10 +1929,8 @@ class CLI:
         # Get tools filtered by current mode
         mode_slug = self._get_session_mode(session)
         mode_config = self._prompt_builder.mode_manager.get(mode_slug)
-        filtered_tools = self._prompt_builder.tool_catalog.filter_for_mode(mode_config)
-        
-        # Convert to OpenAI format for native tool calling
-        tools_for_provider = [tool.to_openai_format() for tool in filtered_tools]
+        # Already in OpenAI format for native tool calling, cached per mode
+        tools_for_provider = self._prompt_builder.tool_catalog.openai_tools_for_mode(mode_config)
         
         while True:
             # Track iteration start
@@ -1273,9 +1950,9 @@ class CLI:
                 # First check for tool calls with non-streaming request
                 response = await provider.chat(
                     messages=messages,
-                    model=self._config.llm.model,
-                    temperature=self._config.llm.temperature,
-                    max_tokens=self._config.llm.max_tokens,
+                    model=llm.model,
+                    temperature=llm.temperature,
+                    max_tokens=llm.max_tokens,
                     tools=tools_for_provider if tools_for_provider else None
                 )
                 
@@ -1288,78 +1965,32 @@ class CLI:
                 if tool_calls:
                     self._renderer.stop_live_stream()
                     messages.append(message)
-                    
-                    # Update tool action mapper working directory
-                    self._tool_action_mapper.working_dir = self._tools.working_dir
-                    
-                    for i, tool_call in enumerate(tool_calls):
-                        func = tool_call.get("function", {})
-                        tool_name = func.get("name", "")
-                        tool_id = tool_call.get("id", "")
-                        
-                        try:
-                            args = json.loads(func.get("arguments", "{}"))
-                        except json.JSONDecodeError:
-                            args = {}
-                        
-                        # Track tool call for project analysis verification
-                        # Requirements: 1.1 - Track tool calls to verify list_directory was invoked
-                        if hasattr(self, '_session_tool_calls'):
-                            self._session_tool_calls.append(tool_name)
-                        
-                        # Capture state before execution for accurate create/update detection
-                        # Requirements: 8.1 - Detect file creation vs update based on file existence
-                        pre_state = self._tool_action_mapper.render_tool_action_before(
-                            tool_name, args
-                        )
-                        
-                        # Execute the tool
-                        try:
-                            result = self._tools.execute(tool_name, args)
-                            success = not result.startswith("Error:")
-                        except Exception as e:
-                            result = str(e)
-                            success = False
-                        
-                        # Render action card after execution with captured state
-                        # Requirements: 8.1, 8.2 - Generate appropriate action cards
-                        self._tool_action_mapper.render_tool_action_after(
-                            pre_state, result=result, success=success
-                        )
-                        
-                        messages.append({
-                            "role": "tool",
-                            "tool_call_id": tool_id,
-                            "content": result or ""
-                        })
+                    messages.extend(await self._execute_native_tool_calls(tool_calls))
                     continue
                 
                 # No tool calls - continue streaming for real-time reasoning display
                 
-                # Initialize streaming progress indicator for extended silence detection
+                # Reuse the streaming progress indicator; start() resets its timing state
                 # Requirements: 5.1, 5.4 - Show "still thinking" indicator for extended silence
-                progress_config = StreamingProgressConfig(
-                    thinking_timeout_seconds=5.0,
-                    show_cancel_hint=True
-                )
-                progress_indicator = StreamingProgressIndicator(
-                    self._renderer.console,
-                    config=progress_config
-                )
+                progress_indicator = self._progress_indicator
                 progress_indicator.start()
                 
+                # Batch chunks so the live display re-renders per batch, not per token
+                coalescer = _StreamCoalescer(self._renderer.update_live_stream)
+                
                 try:
                     async for chunk in provider.chat_stream(
                         messages=messages,
-                        model=self._config.llm.model,
-                        temperature=self._config.llm.temperature,
-                        max_tokens=self._config.llm.max_tokens
+                        model=llm.model,
+                        temperature=llm.temperature,
+                        max_tokens=llm.max_tokens
                     ):
-                        self._renderer.update_live_stream(chunk.content)
+                        coalescer.add(chunk.content)
                         # Record content arrival to reset timeout timer
                         # Requirements: 5.4 - Track content arrival for timeout detection
                         progress_indicator.on_content_received()
                 finally:
+                    coalescer.flush()
                     progress_indicator.stop()
                     response_content, reasoning_content = self._renderer.stop_live_stream()
                 
@@ -1390,24 +2021,24 @@ class CLI:
                 if response_content and not self._renderer.was_response_printed():
                     self._renderer.print_message(response_content, role="assistant")
                 if response_content:
-                    session.add_message("assistant", response_content, tokens=len(response_content)//4)
+                    tokens = count_tokens(response_content)
+                    session.add_message("assistant", response_content, tokens=tokens)
                     self._sessions.save_session(session)
                     
                     if self._config.ui.show_token_count:
-                        self._renderer.print(f"[dim]{len(response_content)//4} tokens[/dim]")
+                        self._renderer.print(f"[dim]{tokens} tokens[/dim]")
                 
                 # Detect and warn about skipped tool invocations
                 # Requirements: 4.4 - Warn user when tool invocation is skipped
                 if response_content:
-                    skipped_detections = detect_skipped_tools(response_content, [])
-                    
-                    for detection in skipped_detections:
-                        if detection.detected and detection.confidence >= 0.6:
-                            self._renderer.print_tool_warning(
-                                message="The assistant described an action but did not execute it.",
-                                suggested_tool=detection.suggested_tool,
-                                detected_action=detection.action_description
-                            )
+                    # One warning is enough, so stop scanning at the first hit
+                    detection = find_skipped_tool(response_content, [], 0.6)
+                    if detection is not None:
+                        self._renderer.print_tool_warning(
+                            message="The assistant described an action but did not execute it.",
+                            suggested_tool=detection.suggested_tool,
+                            detected_action=detection.action_description
+                        )
                 
                 break
                 
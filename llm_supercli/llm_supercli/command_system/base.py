@@ -2,9 +2,33 @@
 Base classes for the command system in llm_supercli.
 """
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+def split_first_word(args: str) -> Tuple[str, str]:
+    """
+    Split the first whitespace-separated word off an argument string.
+    
+    Equivalent to args.strip().split(maxsplit=1) padded to two items, but peels
+    the word off with str.partition when it is separated by a plain space.
+    
+    Args:
+        args: Command arguments as a string
+        
+    Returns:
+        Tuple of (first word, remaining arguments), "" where missing
+    """
+    stripped = args.strip()
+    head, _, rest = stripped.partition(" ")
+    # Tabs, newlines and other non-printable whitespace need a real split
+    if not head.isprintable():
+        parts = stripped.split(maxsplit=1)
+        if not parts:
+            return "", ""
+        return parts[0], parts[1] if len(parts) > 1 else ""
+    return head, rest.lstrip()
 
 
 class CommandStatus(Enum):
@@ -15,7 +39,7 @@ class CommandStatus(Enum):
     PENDING = "pending"
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
     """Result of a command execution."""
     status: CommandStatus = CommandStatus.SUCCESS
@@ -23,17 +47,25 @@ class CommandResult:
     data: Any = None
     should_exit: bool = False
     should_clear: bool = False
-    errors: List[str] = field(default_factory=list)
+    # Only set when a command reports more than its message; see error_messages
+    errors: Optional[List[str]] = None
     
     @property
     def is_success(self) -> bool:
         """Check if command succeeded."""
-        return self.status == CommandStatus.SUCCESS
+        return self.status is CommandStatus.SUCCESS
     
     @property
     def is_error(self) -> bool:
         """Check if command failed."""
-        return self.status == CommandStatus.ERROR
+        return self.status is CommandStatus.ERROR
+    
+    @property
+    def error_messages(self) -> List[str]:
+        """Get the error messages, defaulting to the message for errors."""
+        if self.errors is not None:
+            return self.errors
+        return [self.message] if self.status is CommandStatus.ERROR else []
     
     @classmethod
     def success(cls, message: str = "", data: Any = None) -> 'CommandResult':
@@ -46,7 +78,7 @@ class CommandResult:
         return cls(
             status=CommandStatus.ERROR,
             message=message,
-            errors=errors or [message]
+            errors=errors or None
         )
     
     @classmethod
@@ -62,7 +94,11 @@ class CommandResult:
     @classmethod
     def clear(cls) -> 'CommandResult':
         """Create a clear screen result."""
-        return cls(status=CommandStatus.SUCCESS, should_clear=True)
+        return _CLEAR_RESULT
+
+
+# Shared results for fixed, payload-free outcomes; do not mutate them
+_CLEAR_RESULT = CommandResult(status=CommandStatus.SUCCESS, should_clear=True)
 
 
 class SlashCommand(ABC):
@@ -75,16 +111,27 @@ class SlashCommand(ABC):
     
     name: str = ""
     description: str = ""
-    aliases: List[str] = []
+    aliases: Sequence[str] = ()
     usage: str = ""
-    examples: List[str] = []
+    examples: Sequence[str] = ()
     hidden: bool = False
     requires_auth: bool = False
     
-    def __init__(self) -> None:
-        """Initialize the command."""
-        if not self.name:
-            self.name = self.__class__.__name__.lower().replace("command", "")
+    # Rendered get_help() text, filled in on first use
+    _help_text: Optional[str] = None
+    # Whether name was derived from the class name rather than set explicitly
+    _name_derived: bool = False
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Derive a default command name from the class name, once per class."""
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get("name"):
+            cls._name_derived = False
+        elif not cls.name or cls._name_derived:
+            # Derived names (e.g. CommandGroup's) are not inherited, so every
+            # subclass without an explicit name gets its own
+            cls.name = cls.__name__.lower().replace("command", "")
+            cls._name_derived = True
     
     @abstractmethod
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
@@ -110,7 +157,14 @@ class SlashCommand(ABC):
         return self.run(args, **kwargs)
     
     def get_help(self) -> str:
-        """Get detailed help text for the command."""
+        """Get detailed help text for the command.
+        
+        The text only depends on static class attributes, so it is built
+        once and reused.
+        """
+        if self._help_text is not None:
+            return self._help_text
+        
         parts = [
             f"**/{self.name}** - {self.description}",
         ]
@@ -126,7 +180,8 @@ class SlashCommand(ABC):
             for example in self.examples:
                 parts.append(f"  `{example}`")
         
-        return "\n".join(parts)
+        self._help_text = "\n".join(parts)
+        return self._help_text
     
     def validate_args(self, args: str) -> Optional[str]:
         """
@@ -150,12 +205,12 @@ class SlashCommand(ABC):
         result = {"_raw": args, "_parts": parts}
         
         for part in parts:
-            if "=" in part:
-                key, value = part.split("=", 1)
+            key, eq, value = part.partition("=")
+            if eq:
                 result[key.lstrip("-")] = value
-            elif part.startswith("--"):
+            elif part[:2] == "--":
                 result[part[2:]] = True
-            elif part.startswith("-"):
+            elif part[:1] == "-":
                 result[part[1:]] = True
         
         return result
@@ -187,11 +242,15 @@ class CommandGroup(SlashCommand):
     
     subcommands: dict = {}
     
+    def __init__(self) -> None:
+        """Initialize the command group with its own subcommand table."""
+        super().__init__()
+        # Copy so register_subcommand never touches a dict shared by other groups
+        self.subcommands = dict(self.subcommands)
+    
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Route to subcommand or show help."""
-        parts = args.split(maxsplit=1)
-        subcommand = parts[0] if parts else ""
-        subargs = parts[1] if len(parts) > 1 else ""
+        subcommand, subargs = split_first_word(args)
         
         if not subcommand or subcommand == "help":
             return self._show_help()
@@ -2,6 +2,32 @@
 from typing import Any
 
 from ..base import SlashCommand, CommandResult
+from ...auth import get_session_manager
+from ...history import get_session_store
+
+
+# Output sections, filled in with str.format_map
+_AUTHENTICATED_TEMPLATE = (
+    "## Authentication\n"
+    "**Status:** ✅ Logged in\n"
+    "**Provider:** {provider}\n"
+    "**Name:** {name}\n"
+    "**Email:** {email}\n"
+    "\n"
+)
+_NOT_AUTHENTICATED = (
+    "## Authentication\n"
+    "**Status:** ❌ Not logged in\n"
+    "\n"
+    "Use `/login google` or `/login github` to authenticate.\n"
+    "\n"
+)
+_USAGE_TEMPLATE = (
+    "## Usage Statistics\n"
+    "**Total Sessions:** {sessions}\n"
+    "**Total Tokens:** {tokens:,}\n"
+    "**Total Cost:** ${cost:.4f}"
+)
 
 
 class AccountCommand(SlashCommand):
@@ -13,41 +39,26 @@ class AccountCommand(SlashCommand):
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute account command."""
-        from ...auth import get_session_manager
-        from ...history import get_session_store
-        
         session_manager = get_session_manager()
         store = get_session_store()
         
-        lines = ["# Account Information", ""]
-        
         if session_manager.is_authenticated():
             user = session_manager.get_user_info()
-            lines.extend([
-                "## Authentication",
-                f"**Status:** ✅ Logged in",
-                f"**Provider:** {user.get('provider', 'Unknown').title()}",
-                f"**Name:** {user.get('name', 'N/A')}",
-                f"**Email:** {user.get('email', 'N/A')}",
-                ""
-            ])
+            auth_section = _AUTHENTICATED_TEMPLATE.format_map({
+                "provider": user.get('provider', 'Unknown').title(),
+                "name": user.get('name', 'N/A'),
+                "email": user.get('email', 'N/A'),
+            })
         else:
-            lines.extend([
-                "## Authentication",
-                "**Status:** ❌ Not logged in",
-                "",
-                "Use `/login google` or `/login github` to authenticate.",
-                ""
-            ])
+            auth_section = _NOT_AUTHENTICATED
         
         usage = store.get_total_usage()
-        session_count = store.get_session_count()
-        
-        lines.extend([
-            "## Usage Statistics",
-            f"**Total Sessions:** {session_count}",
-            f"**Total Tokens:** {usage['tokens']:,}",
-            f"**Total Cost:** ${usage['cost']:.4f}",
-        ])
+        usage_section = _USAGE_TEMPLATE.format_map({
+            "sessions": store.get_session_count(),
+            "tokens": usage['tokens'],
+            "cost": usage['cost'],
+        })
         
-        return CommandResult.success("\n".join(lines))
+        return CommandResult.success(
+            "# Account Information\n\n" + auth_section + usage_section
+        )
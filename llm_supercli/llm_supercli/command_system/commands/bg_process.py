@@ -1,6 +1,10 @@
 """Background process command for llm_supercli."""
 from typing import Any
-from ..base import SlashCommand, CommandResult
+from ..base import SlashCommand, CommandResult, split_first_word
+
+# Fixed error results shared across calls; do not mutate them
+_MISSING_PID = CommandResult.error("Please specify a process ID")
+_UNKNOWN_SUBCOMMAND = CommandResult.error("Unknown subcommand. Use: list, kill")
 
 
 class BGProcessCommand(SlashCommand):
@@ -13,27 +17,36 @@ class BGProcessCommand(SlashCommand):
     
     _processes: dict = {}
     
+    # Subcommand name -> handler method name, resolved on the instance
+    _DISPATCH = {
+        "list": "_list_processes",
+        "kill": "_kill_process",
+    }
+    
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
-        parts = args.strip().split()
-        subcommand = parts[0].lower() if parts else "list"
-        
-        if subcommand == "list":
-            if not self._processes:
-                return CommandResult.success("No background processes running")
-            
-            lines = ["# Background Processes", ""]
-            for pid, info in self._processes.items():
-                lines.append(f"- [{pid}] {info.get('command', 'Unknown')}")
-            return CommandResult.success("\n".join(lines))
+        subcommand, subargs = split_first_word(args)
+        handler = self._DISPATCH.get(subcommand.lower() or "list")
+        if handler is None:
+            return _UNKNOWN_SUBCOMMAND
+        return getattr(self, handler)(subargs)
+    
+    def _list_processes(self, args: str) -> CommandResult:
+        """List running background processes."""
+        if not self._processes:
+            return CommandResult.success("No background processes running")
         
-        elif subcommand == "kill":
-            if len(parts) < 2:
-                return CommandResult.error("Please specify a process ID")
-            
-            pid = parts[1]
-            if pid in self._processes:
-                del self._processes[pid]
-                return CommandResult.success(f"Killed process {pid}")
-            return CommandResult.error(f"Process not found: {pid}")
+        lines = ["# Background Processes", ""]
+        for pid, info in self._processes.items():
+            lines.append(f"- [{pid}] {info.get('command', 'Unknown')}")
+        return CommandResult.success("\n".join(lines))
+    
+    def _kill_process(self, args: str) -> CommandResult:
+        """Stop tracking a background process by pid."""
+        pid = split_first_word(args)[0]
+        if not pid:
+            return _MISSING_PID
         
-        return CommandResult.error("Unknown subcommand. Use: list, kill")
+        if pid in self._processes:
+            del self._processes[pid]
+            return CommandResult.success(f"Killed process {pid}")
+        return CommandResult.error(f"Process not found: {pid}")
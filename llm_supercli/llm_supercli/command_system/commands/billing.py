@@ -1,6 +1,7 @@
 """Billing command for llm_supercli."""
 from typing import Any
 from ..base import SlashCommand, CommandResult
+from ...auth import get_session_manager
 
 
 class BillingCommand(SlashCommand):
@@ -11,8 +12,6 @@ class BillingCommand(SlashCommand):
     requires_auth = True
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
-        from ...auth import get_session_manager
-        
         if not get_session_manager().is_authenticated():
             return CommandResult.error("Please login first with /login")
         
@@ -1,4 +1,5 @@
 """Bug report command for llm_supercli."""
+import webbrowser
 from typing import Any
 from ..base import SlashCommand, CommandResult
 
@@ -11,8 +12,6 @@ class BugCommand(SlashCommand):
     usage = "[description]"
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
-        import webbrowser
-        
         if args.strip():
             return CommandResult.success(
                 f"Bug report noted: {args}\n\n"
@@ -2,6 +2,7 @@
 from typing import Any
 
 from ..base import SlashCommand, CommandResult
+from ...history import get_session_store
 
 
 class CompressCommand(SlashCommand):
@@ -13,8 +14,6 @@ class CompressCommand(SlashCommand):
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute compress command."""
-        from ...history import get_session_store
-        
         store = get_session_store()
         session = store.current_session
         
@@ -29,21 +28,24 @@ class CompressCommand(SlashCommand):
         original_count = session.message_count
         original_tokens = session.total_tokens
         
-        system_msgs = [m for m in session.messages if m.role == "system"]
-        recent_msgs = session.messages[-4:]
+        messages = session.messages
+        recent_msgs = messages[-4:]
         
-        if args.strip():
-            summary = args.strip()
-        else:
-            all_content = "\n".join(
-                f"{m.role}: {m.content[:200]}..." 
-                for m in session.messages[:-4]
-            )
-            summary = f"[Previous conversation summary: {len(session.messages) - 4} messages about various topics]"
+        # Collect system messages and their token estimate in one pass
+        system_msgs = []
+        estimated_new_tokens = 0
+        for m in messages:
+            if m.role == "system":
+                system_msgs.append(m)
+                estimated_new_tokens += len(m.content) // 4
+        
+        summary = args.strip()
+        if not summary:
+            summary = f"[Previous conversation summary: {len(messages) - 4} messages about various topics]"
         
         session.messages = system_msgs
         
-        session.add_message(
+        summary_msg = session.add_message(
             role="system",
             content=f"Context summary: {summary}"
         )
@@ -51,7 +53,8 @@ class CompressCommand(SlashCommand):
         session.messages.extend(recent_msgs)
         session.message_count = len(session.messages)
         
-        estimated_new_tokens = sum(len(m.content) // 4 for m in session.messages)
+        estimated_new_tokens += len(summary_msg.content) // 4
+        estimated_new_tokens += sum(len(m.content) // 4 for m in recent_msgs)
         
         store.save_session(session)
         
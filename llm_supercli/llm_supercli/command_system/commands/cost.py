@@ -2,10 +2,30 @@
 from typing import Any
 
 from ..base import SlashCommand, CommandResult
+from ...history import get_session_store
 
 
 # OAuth-based free tier providers
-FREE_PROVIDERS = ["gemini", "qwen"]
+FREE_PROVIDERS = frozenset({"gemini", "qwen"})
+
+# Output sections, filled in with str.format_map
+_SESSION_HEADER = (
+    "## Current Session\n"
+    "**Provider:** {provider}\n"
+    "**Model:** {model}\n"
+    "**Messages:** {messages}\n"
+    "**Total Tokens:** {tokens:,}\n"
+)
+_SESSION_TEMPLATE = _SESSION_HEADER + "**Estimated Cost:** ${cost:.4f}\n\n"
+_FREE_SESSION_TEMPLATE = _SESSION_HEADER + "**Cost:** Free (OAuth tier)\n\n"
+_TOTALS_TEMPLATE = (
+    "## All-Time Usage\n"
+    "**Total Sessions:** {sessions}\n"
+    "**Total Tokens:** {tokens:,}\n"
+    "**Total Cost:** ${cost:.4f}\n"
+    "\n"
+    "[dim]Note: Gemini and Qwen use free OAuth tiers[/dim]"
+)
 
 
 class CostCommand(SlashCommand):
@@ -17,40 +37,28 @@ class CostCommand(SlashCommand):
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute cost command."""
-        from ...history import get_session_store
-        
         store = get_session_store()
         session = store.current_session
         total = store.get_total_usage()
         
-        lines = ["# Usage & Cost Summary", ""]
+        parts = ["# Usage & Cost Summary\n\n"]
         
         if session:
             provider = session.provider.lower() if session.provider else ""
-            is_free = provider in FREE_PROVIDERS
-            
-            lines.extend([
-                "## Current Session",
-                f"**Provider:** {session.provider.title() if session.provider else 'Unknown'}",
-                f"**Model:** {session.model or 'Unknown'}",
-                f"**Messages:** {session.message_count}",
-                f"**Total Tokens:** {session.total_tokens:,}",
-            ])
-            
-            if is_free:
-                lines.append("**Cost:** Free (OAuth tier)")
-            else:
-                lines.append(f"**Estimated Cost:** ${session.total_cost:.4f}")
-            
-            lines.append("")
+            template = _FREE_SESSION_TEMPLATE if provider in FREE_PROVIDERS else _SESSION_TEMPLATE
+            parts.append(template.format_map({
+                # title() recases every letter, so the lowered name gives the same result
+                "provider": provider.title() or "Unknown",
+                "model": session.model or "Unknown",
+                "messages": session.message_count,
+                "tokens": session.total_tokens,
+                "cost": session.total_cost,
+            }))
         
-        lines.extend([
-            "## All-Time Usage",
-            f"**Total Sessions:** {store.get_session_count()}",
-            f"**Total Tokens:** {total['tokens']:,}",
-            f"**Total Cost:** ${total['cost']:.4f}",
-            "",
-            "[dim]Note: Gemini and Qwen use free OAuth tiers[/dim]"
-        ])
+        parts.append(_TOTALS_TEMPLATE.format_map({
+            "sessions": store.get_session_count(),
+            "tokens": total["tokens"],
+            "cost": total["cost"],
+        }))
         
-        return CommandResult.success("\n".join(lines))
+        return CommandResult.success("".join(parts))
@@ -1,6 +1,10 @@
 """Custom commands support for llm_supercli."""
 from typing import Any
-from ..base import SlashCommand, CommandResult
+from ..base import SlashCommand, CommandResult, split_first_word
+
+# Fixed error results shared across calls; do not mutate them
+_MISSING_NAME = CommandResult.error("Please provide a command name")
+_UNKNOWN_SUBCOMMAND = CommandResult.error("Unknown subcommand. Use: list, add, remove, edit")
 
 
 class CustomCommandsCommand(SlashCommand):
@@ -15,37 +19,43 @@ class CustomCommandsCommand(SlashCommand):
         "/custom remove mycommand"
     ]
     
+    # Subcommand name -> handler taking (command, name argument)
+    _DISPATCH = {
+        "list": lambda self, name: self._list_commands(),
+        "add": lambda self, name: self._add_command(name),
+        "remove": lambda self, name: self._find_command(name),
+        "edit": lambda self, name: self._find_command(name),
+    }
+    
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
-        parts = args.strip().split(maxsplit=1)
-        subcommand = parts[0].lower() if parts else "list"
-        subargs = parts[1] if len(parts) > 1 else ""
-        
-        if subcommand == "list":
-            return CommandResult.success(
-                "# Custom Commands\n\n"
-                "No custom commands defined.\n\n"
-                "Use `/custom add <name>` to create a custom command."
-            )
-        
-        elif subcommand == "add":
-            if not subargs:
-                return CommandResult.error("Please provide a command name")
-            return CommandResult.success(
-                f"Custom command creation for '{subargs}' coming soon!\n\n"
-                "Custom commands will allow you to:\n"
-                "- Define reusable prompts\n"
-                "- Create shortcuts for common tasks\n"
-                "- Chain multiple operations"
-            )
-        
-        elif subcommand == "remove":
-            if not subargs:
-                return CommandResult.error("Please provide a command name")
-            return CommandResult.error(f"Custom command '{subargs}' not found")
-        
-        elif subcommand == "edit":
-            if not subargs:
-                return CommandResult.error("Please provide a command name")
-            return CommandResult.error(f"Custom command '{subargs}' not found")
-        
-        return CommandResult.error("Unknown subcommand. Use: list, add, remove, edit")
+        subcommand, subargs = split_first_word(args)
+        handler = self._DISPATCH.get(subcommand.lower() or "list")
+        if handler is None:
+            return _UNKNOWN_SUBCOMMAND
+        return handler(self, subargs)
+    
+    def _list_commands(self) -> CommandResult:
+        """List the defined custom commands."""
+        return CommandResult.success(
+            "# Custom Commands\n\n"
+            "No custom commands defined.\n\n"
+            "Use `/custom add <name>` to create a custom command."
+        )
+    
+    def _add_command(self, name: str) -> CommandResult:
+        """Create a custom command."""
+        if not name:
+            return _MISSING_NAME
+        return CommandResult.success(
+            f"Custom command creation for '{name}' coming soon!\n\n"
+            "Custom commands will allow you to:\n"
+            "- Define reusable prompts\n"
+            "- Create shortcuts for common tasks\n"
+            "- Chain multiple operations"
+        )
+    
+    def _find_command(self, name: str) -> CommandResult:
+        """Look up a custom command to remove or edit."""
+        if not name:
+            return _MISSING_NAME
+        return CommandResult.error(f"Custom command '{name}' not found")
@@ -1,7 +1,8 @@
 """Favorite command for llm_supercli."""
 from typing import Any
 
-from ..base import SlashCommand, CommandResult
+from ..base import SlashCommand, CommandResult, split_first_word
+from ...history import get_session_store, get_favorites_manager
 
 
 class FavoriteCommand(SlashCommand):
@@ -13,27 +14,27 @@ class FavoriteCommand(SlashCommand):
     usage = "[add|remove|list]"
     examples = ["/favorite", "/favorite add", "/favorite list"]
     
+    # Subcommand name -> handler method name, resolved on the instance
+    _DISPATCH = {
+        "add": "_add_favorite",
+        "remove": "_remove_favorite",
+        "list": "_list_favorites",
+    }
+    
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute favorite command."""
-        from ...history import get_session_store, get_favorites_manager
-        
         store = get_session_store()
         favorites = get_favorites_manager()
         
-        parts = args.strip().split(maxsplit=1)
-        subcommand = parts[0].lower() if parts else "add"
-        subargs = parts[1] if len(parts) > 1 else ""
+        subcommand, subargs = split_first_word(args)
+        subcommand = subcommand.lower() or "add"
         
-        if subcommand == "add":
-            return self._add_favorite(store, favorites, subargs)
-        elif subcommand == "remove":
-            return self._remove_favorite(store, favorites, subargs)
-        elif subcommand == "list":
-            return self._list_favorites(favorites)
-        else:
+        handler = self._DISPATCH.get(subcommand)
+        if handler is None:
             return CommandResult.error(
                 f"Unknown subcommand: {subcommand}. Use: add, remove, list"
             )
+        return getattr(self, handler)(store, favorites, subargs)
     
     def _add_favorite(self, store, favorites, session_id: str) -> CommandResult:
         """Add current or specified session to favorites."""
@@ -76,7 +77,7 @@ class FavoriteCommand(SlashCommand):
         else:
             return CommandResult.error("Session is not in favorites")
     
-    def _list_favorites(self, favorites) -> CommandResult:
+    def _list_favorites(self, store, favorites, args: str) -> CommandResult:
         """List all favorite sessions."""
         fav_list = favorites.list_favorites(item_type="session")
         
@@ -1,8 +1,16 @@
 """File inclusion command for llm_supercli."""
-from pathlib import Path
+import os
+import re
+import stat
 from typing import Any
 from ..base import SlashCommand, CommandResult
 
+# Bytes checked for NUL when deciding whether a file is binary
+_SNIFF_SIZE = 8192
+
+# Line boundaries str.splitlines() recognises besides \n, \r and \r\n
+_OTHER_LINE_BREAKS_RE = re.compile("[\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
 
 class FileCommand(SlashCommand):
     """Include file contents in the conversation."""
@@ -22,30 +30,47 @@ class FileCommand(SlashCommand):
         if not args.strip():
             return CommandResult.error("Usage: /file <path>\n\nExample: /file readme.md")
         
-        filepath = Path(args.strip()).expanduser()
+        filepath = os.path.expanduser(args.strip())
         
-        if not filepath.exists():
+        try:
+            st = os.stat(filepath)
+        except (FileNotFoundError, NotADirectoryError):
             return CommandResult.error(f"File not found: {filepath}")
+        except OSError as e:
+            return CommandResult.error(f"Error reading file: {e}")
         
-        if not filepath.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return CommandResult.error(f"Not a file: {filepath}")
         
         try:
             # Check file size
-            size = filepath.stat().st_size
+            size = st.st_size
             if size > 1024 * 1024:  # 1MB limit
                 return CommandResult.error(f"File too large: {size / 1024:.1f} KB (max 1MB)")
             
-            # Read file
-            content = filepath.read_text(encoding='utf-8', errors='replace')
+            # Read file, sniffing the first block for NUL bytes so binaries
+            # are rejected before anything is decoded
+            with open(filepath, 'rb') as f:
+                head = f.read(_SNIFF_SIZE)
+                if b"\0" in head:
+                    return CommandResult.error(f"Not a text file: {filepath}")
+                content = (head + f.read()).decode('utf-8', errors='replace')
+            # Translate newlines as text-mode reading would
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
             
-            # Format output
-            lines = len(content.splitlines())
-            output = f"**Included: {filepath.name}** ({lines} lines)\n\n```\n{content}\n```"
+            # Format output; a trailing newline does not start another line
+            if _OTHER_LINE_BREAKS_RE.search(content):
+                lines = len(content.splitlines())
+            else:
+                lines = content.count("\n")
+                if content and not content.endswith("\n"):
+                    lines += 1
+            output = f"**Included: {os.path.basename(filepath)}** ({lines} lines)\n\n```\n{content}\n```"
             
             return CommandResult.success(
                 message=output,
-                data={"content": content, "path": str(filepath)}
+                data={"content": content, "path": filepath}
             )
             
         except Exception as e:
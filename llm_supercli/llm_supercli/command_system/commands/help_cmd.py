@@ -1,9 +1,6 @@
 """Help command for llm_supercli."""
 from typing import Any
 
-from rich.console import Console
-from rich.text import Text
-
 from ..base import SlashCommand, CommandResult
 from ..registry import get_command_registry
 
@@ -17,6 +14,10 @@ class HelpCommand(SlashCommand):
     usage = "[command]"
     examples = ["/help", "/help model", "/help mcp"]
     
+    # Rendered listing and the registry version it was built for
+    _cached_version: int = -1
+    _cached_lines: tuple = ()
+    
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute help command."""
         registry = get_command_registry()
@@ -30,25 +31,46 @@ class HelpCommand(SlashCommand):
             else:
                 return CommandResult.error(f"Unknown command: {command_name}")
         
-        commands = registry.list_commands()
+        # rich is only needed for the full listing, so import it on demand
+        from rich.console import Console
         
         console = Console()
         
-        max_name_len = max(len(cmd['name']) for cmd in commands) if commands else 10
+        for line in self._command_lines(registry):
+            console.print(line)
+        
+        console.print()
+        console.print("Other commands will be passed to the LLM.", style="dim")
+        
+        return CommandResult.success("")
+    
+    def _command_lines(self, registry: Any) -> tuple:
+        """Get the styled command listing, rebuilt only when commands change.
+        
+        Args:
+            registry: The command registry to list
+            
+        Returns:
+            Tuple of Text lines: the header, a blank line, then one per command
+        """
+        if self._cached_version == registry.version:
+            return self._cached_lines
+        
+        from rich.text import Text
+        
+        commands, max_name_len = registry.get_sorted_commands()
         
         header = Text()
         header.append("● ", style="cyan")
         header.append("Available Commands:", style="bold")
-        console.print(header)
-        console.print()
+        lines = [header, Text()]
         
-        for cmd in sorted(commands, key=lambda x: x['name']):
+        for cmd in commands:
             line = Text()
             line.append(f"  /{cmd['name']:<{max_name_len + 2}}", style="cyan")
             line.append(f"- {cmd['description']}", style="dim")
-            console.print(line)
+            lines.append(line)
         
-        console.print()
-        console.print("Other commands will be passed to the LLM.", style="dim")
-        
-        return CommandResult.success("")
+        self._cached_lines = tuple(lines)
+        self._cached_version = registry.version
+        return self._cached_lines
@@ -1,7 +1,25 @@
 """IDE command for llm_supercli."""
-from typing import Any
+import shutil
+import subprocess
+from typing import Any, Optional
 from ..base import SlashCommand, CommandResult
 
+# Editors tried in order of preference
+_EDITORS = ("code", "cursor", "subl", "atom", "vim", "nano")
+
+# First editor that launched successfully; reused to skip the PATH search
+_cached_editor: Optional[str] = None
+
+
+def _launch(editor: str, path: str) -> None:
+    """Start an editor without waiting for it.
+    
+    Keeping inherited file descriptors lets CPython use its posix_spawn /
+    vfork fast path instead of fork plus a close loop over every fd. The
+    terminal is still shared, so console editors like vim keep working.
+    """
+    subprocess.Popen([editor, path], close_fds=False)
+
 
 class IDECommand(SlashCommand):
     """Open in IDE."""
@@ -12,17 +30,22 @@ class IDECommand(SlashCommand):
     examples = ["/ide", "/ide main.py", "/ide ./src"]
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
-        import subprocess
-        import shutil
-        
+        global _cached_editor
         path = args.strip() or "."
         
-        editors = ["code", "cursor", "subl", "atom", "vim", "nano"]
+        if _cached_editor is not None:
+            try:
+                _launch(_cached_editor, path)
+                return CommandResult.success(f"Opened `{path}` in {_cached_editor}")
+            except Exception:
+                # Editor went away; search PATH again
+                _cached_editor = None
         
-        for editor in editors:
+        for editor in _EDITORS:
             if shutil.which(editor):
                 try:
-                    subprocess.Popen([editor, path])
+                    _launch(editor, path)
+                    _cached_editor = editor
                     return CommandResult.success(f"Opened `{path}` in {editor}")
                 except Exception as e:
                     continue
@@ -1,4 +1,5 @@
 """Install GitHub App command for llm_supercli."""
+import webbrowser
 from typing import Any
 from ..base import SlashCommand, CommandResult
 
@@ -11,8 +12,6 @@ class InstallGitHubAppCommand(SlashCommand):
     hidden = True
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
-        import webbrowser
-        
         url = "https://github.com/apps/llm-supercli"
         
         try:
@@ -1,7 +1,9 @@
 """API Key command for llm_supercli."""
 from typing import Any
 
-from ..base import SlashCommand, CommandResult
+from ..base import SlashCommand, CommandResult, split_first_word
+from ...config import get_config
+from ...llm import get_provider_registry
 
 
 class KeyCommand(SlashCommand):
@@ -31,32 +33,32 @@ class KeyCommand(SlashCommand):
         "gemini": "GEMINI_API_KEY",
     }
     
+    # Listing order and error text are fixed, so build them once ("hf" is an alias)
+    _PROVIDERS_SORTED = tuple(sorted(
+        (k, v) for k, v in PROVIDER_ENV_MAP.items() if k != "hf"
+    ))
+    _AVAILABLE_STR = ", ".join(k for k, _ in _PROVIDERS_SORTED)
+    
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute key command."""
-        from ...config import get_config
-        from ...llm import get_provider_registry
-        
         config = get_config()
         registry = get_provider_registry()
         
-        parts = args.strip().split(maxsplit=1)
+        provider_name, api_key = split_first_word(args)
+        provider_name = provider_name.lower()
         
-        if not parts or parts[0].lower() == "list":
+        if not provider_name or provider_name == "list":
             return self._list_keys(config, registry)
         
-        provider_name = parts[0].lower()
-        
         if provider_name not in self.PROVIDER_ENV_MAP:
-            available = ", ".join(sorted(set(self.PROVIDER_ENV_MAP.keys()) - {"hf"}))
             return CommandResult.error(
                 f"Unknown provider: {provider_name}\n"
-                f"Available providers: {available}"
+                f"Available providers: {self._AVAILABLE_STR}"
             )
         
-        if len(parts) < 2:
+        if not api_key:
             return self._show_key_status(config, provider_name)
         
-        api_key = parts[1].strip()
         return self._set_key(config, registry, provider_name, api_key)
     
     def _list_keys(self, config, registry) -> CommandResult:
@@ -68,7 +70,7 @@ class KeyCommand(SlashCommand):
             "|----------|--------|--------------|",
         ]
         
-        for provider, env_key in sorted(set((k, v) for k, v in self.PROVIDER_ENV_MAP.items() if k != "hf")):
+        for provider, env_key in self._PROVIDERS_SORTED:
             key_value = config.get_api_key(env_key)
             if key_value:
                 masked = key_value[:4] + "..." + key_value[-4:] if len(key_value) > 8 else "****"
@@ -2,6 +2,29 @@
 from typing import Any
 
 from ..base import AsyncSlashCommand, CommandResult
+from ...auth import GoogleOAuth, GitHubOAuth, GeminiOAuth, QwenOAuth, get_session_manager
+from ...constants import GOOGLE_CLIENT_ID, GITHUB_CLIENT_ID
+
+
+# OAuth handler class per provider
+_OAUTH_CLASSES = {
+    "google": GoogleOAuth,
+    "github": GitHubOAuth,
+    "gemini": GeminiOAuth,
+    "qwen": QwenOAuth,
+}
+
+# Handlers reused across /login calls, so state they resolve once (such
+# as the Gemini client config) is not fetched again on a retry
+_oauth_clients: dict[str, Any] = {}
+
+
+def _get_oauth(provider: str) -> Any:
+    """Get the shared OAuth handler for a provider, creating it on first use."""
+    oauth = _oauth_clients.get(provider)
+    if oauth is None:
+        oauth = _oauth_clients[provider] = _OAUTH_CLASSES[provider]()
+    return oauth
 
 
 class LoginCommand(AsyncSlashCommand):
@@ -19,9 +42,6 @@ class LoginCommand(AsyncSlashCommand):
     
     async def run_async(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute login command."""
-        from ...auth import GoogleOAuth, GitHubOAuth, GeminiOAuth, QwenOAuth, get_session_manager
-        from ...constants import GOOGLE_CLIENT_ID, GITHUB_CLIENT_ID
-        
         session_manager = get_session_manager()
         provider = args.strip().lower() or "gemini"
         
@@ -33,7 +53,7 @@ class LoginCommand(AsyncSlashCommand):
         
         # Handle Gemini OAuth (LLM provider)
         if provider == "gemini":
-            oauth = GeminiOAuth()
+            oauth = _get_oauth("gemini")
             if oauth.is_authenticated():
                 return CommandResult.success(
                     "Already logged in to Gemini. Use `/logout gemini` to logout first."
@@ -53,7 +73,7 @@ class LoginCommand(AsyncSlashCommand):
         
         # Handle Qwen OAuth (LLM provider)
         if provider == "qwen":
-            oauth = QwenOAuth()
+            oauth = _get_oauth("qwen")
             if oauth.is_authenticated():
                 return CommandResult.success(
                     "Already logged in to Qwen. Use `/logout qwen` to logout first."
@@ -95,10 +115,7 @@ class LoginCommand(AsyncSlashCommand):
                 f"via {provider.title()}"
             )
         
-        if provider == "google":
-            oauth = GoogleOAuth()
-        else:
-            oauth = GitHubOAuth()
+        oauth = _get_oauth(provider)
         
         result_holder = {"code": "", "url": ""}
         
@@ -1,7 +1,9 @@
 """Logout command for llm_supercli."""
+from pathlib import Path
 from typing import Any
 
 from ..base import SlashCommand, CommandResult
+from ...auth import get_session_manager, GeminiOAuth, QwenOAuth
 
 
 class LogoutCommand(SlashCommand):
@@ -19,14 +21,11 @@ class LogoutCommand(SlashCommand):
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute logout command."""
-        from ...auth import get_session_manager, GeminiOAuth, QwenOAuth
-        
         session_manager = get_session_manager()
         provider = args.strip().lower()
         
         # Handle Gemini logout
         if provider == "gemini":
-            from pathlib import Path
             creds_file = Path.home() / ".gemini" / "oauth_creds.json"
             if creds_file.exists():
                 creds_file.unlink()
@@ -44,7 +43,6 @@ class LogoutCommand(SlashCommand):
         if provider == "all":
             session_manager.clear_all_sessions()
             # Also clear LLM provider credentials
-            from pathlib import Path
             gemini_creds = Path.home() / ".gemini" / "oauth_creds.json"
             qwen_creds = Path.home() / ".qwen" / "oauth_creds.json"
             if gemini_creds.exists():
@@ -1,7 +1,40 @@
 """MCP command for llm_supercli."""
-from typing import Any
+from typing import Any, List, Tuple
 
-from ..base import AsyncSlashCommand, CommandResult
+from ..base import AsyncSlashCommand, CommandResult, split_first_word
+from ...mcp import get_mcp_manager, MCPServerConfig
+
+
+def _parse_add_args(parts: List[str]) -> Tuple[str, List[str], str]:
+    """
+    Parse the flags of `/mcp add <name> ...` in one forward pass.
+    
+    Args:
+        parts: Whitespace-split arguments, starting with the server name
+        
+    Returns:
+        Tuple of (command, args, description); missing values are empty
+    """
+    # Flags taking exactly one value; unknown tokens are skipped
+    values = {"--command": "", "--description": ""}
+    server_args: List[str] = []
+    n = len(parts)
+    i = 1
+    while i < n:
+        token = parts[i]
+        if token in values and i + 1 < n:
+            values[token] = parts[i + 1]
+            i += 2
+        elif token == "--args":
+            # Everything up to the next flag is passed to the server
+            end = i + 1
+            while end < n and not parts[end].startswith("--"):
+                end += 1
+            server_args.extend(parts[i + 1:end])
+            i = end
+        else:
+            i += 1
+    return values["--command"], server_args, values["--description"]
 
 
 class MCPCommand(AsyncSlashCommand):
@@ -21,12 +54,9 @@ class MCPCommand(AsyncSlashCommand):
     
     async def run_async(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute MCP command."""
-        from ...mcp import get_mcp_manager, MCPServerConfig
-        
         mcp = get_mcp_manager()
-        parts = args.strip().split(maxsplit=1)
-        subcommand = parts[0].lower() if parts else "list"
-        subargs = parts[1] if len(parts) > 1 else ""
+        subcommand, subargs = split_first_word(args)
+        subcommand = subcommand.lower() or "list"
         
         if subcommand == "list":
             return self._list_servers(mcp)
@@ -120,8 +150,10 @@ class MCPCommand(AsyncSlashCommand):
         
         for server, tools in all_tools.items():
             lines.append(f"## {server}")
-            for tool in tools:
-                lines.append(f"  - **{tool['name']}**: {tool['description'][:60]}...")
+            lines.extend([
+                f"  - **{tool['name']}**: {tool['description'][:60]}..."
+                for tool in tools
+            ])
             lines.append("")
         
         return CommandResult.success("\n".join(lines))
@@ -137,16 +169,16 @@ class MCPCommand(AsyncSlashCommand):
         
         for server, resources in all_resources.items():
             lines.append(f"## {server}")
-            for resource in resources:
-                lines.append(f"  - **{resource['name']}**: `{resource['uri']}`")
+            lines.extend([
+                f"  - **{resource['name']}**: `{resource['uri']}`"
+                for resource in resources
+            ])
             lines.append("")
         
         return CommandResult.success("\n".join(lines))
     
     def _add_server(self, mcp, args: str) -> CommandResult:
         """Add an MCP server."""
-        from ...mcp import MCPServerConfig
-        
         parts = args.split()
         if not parts:
             return CommandResult.error(
@@ -154,25 +186,7 @@ class MCPCommand(AsyncSlashCommand):
             )
         
         name = parts[0]
-        command = ""
-        server_args = []
-        description = ""
-        
-        i = 1
-        while i < len(parts):
-            if parts[i] == "--command" and i + 1 < len(parts):
-                command = parts[i + 1]
-                i += 2
-            elif parts[i] == "--args":
-                i += 1
-                while i < len(parts) and not parts[i].startswith("--"):
-                    server_args.append(parts[i])
-                    i += 1
-            elif parts[i] == "--description" and i + 1 < len(parts):
-                description = parts[i + 1]
-                i += 2
-            else:
-                i += 1
+        command, server_args, description = _parse_add_args(parts)
         
         if not command:
             return CommandResult.error("Please specify --command")
@@ -210,11 +224,10 @@ class MCPCommand(AsyncSlashCommand):
             ""
         ]
         
-        for name, info in status['servers'].items():
-            status_icon = "🟢" if info['connected'] else "⚪"
-            lines.append(
-                f"- {status_icon} **{name}**: "
-                f"{info['tools']} tools, {info['resources']} resources"
-            )
+        lines.extend([
+            f"- {'🟢' if info['connected'] else '⚪'} **{name}**: "
+            f"{info['tools']} tools, {info['resources']} resources"
+            for name, info in status['servers'].items()
+        ])
         
         return CommandResult.success("\n".join(lines))
@@ -2,6 +2,7 @@
 from typing import Any
 
 from ..base import SlashCommand, CommandResult
+from ...prompts.modes import ModeManager
 
 
 class ModeCommand(SlashCommand):
@@ -21,8 +22,6 @@ class ModeCommand(SlashCommand):
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute mode command."""
-        from ...prompts.modes import ModeManager
-        
         args = args.strip().lower()
         
         # Get the CLI instance to access current mode
@@ -2,6 +2,9 @@
 from typing import Any
 
 from ..base import SlashCommand, CommandResult
+from ...config import get_config
+from ...llm import get_provider_registry
+from ...rich_ui.menu import select_model_interactive
 
 
 class ModelCommand(SlashCommand):
@@ -22,10 +25,6 @@ class ModelCommand(SlashCommand):
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute model command."""
-        from ...config import get_config
-        from ...llm import get_provider_registry
-        from ...rich_ui.menu import select_model_interactive
-        
         config = get_config()
         registry = get_provider_registry()
         
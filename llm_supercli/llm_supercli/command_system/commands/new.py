@@ -2,6 +2,8 @@
 from typing import Any
 
 from ..base import SlashCommand, CommandResult
+from ...config import get_config
+from ...history import get_session_store
 
 
 class NewCommand(SlashCommand):
@@ -15,9 +17,6 @@ class NewCommand(SlashCommand):
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute new session command."""
-        from ...history import get_session_store
-        from ...config import get_config
-        
         store = get_session_store()
         config = get_config()
         
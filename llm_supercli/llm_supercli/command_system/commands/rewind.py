@@ -2,6 +2,7 @@
 from typing import Any
 
 from ..base import SlashCommand, CommandResult
+from ...history import get_session_store
 
 
 class RewindCommand(SlashCommand):
@@ -15,8 +16,6 @@ class RewindCommand(SlashCommand):
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute rewind command."""
-        from ...history import get_session_store
-        
         store = get_session_store()
         session = store.current_session
         
@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Any
 
 from ..base import SlashCommand, CommandResult
+from ...prompts.rules import RulesLoader
 
 
 class RulesCommand(SlashCommand):
@@ -21,8 +22,6 @@ class RulesCommand(SlashCommand):
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute rules command."""
-        from ...prompts.rules import RulesLoader
-        
         args = args.strip()
         parts = args.split(maxsplit=1)
         subcommand = parts[0].lower() if parts else ""
@@ -2,6 +2,7 @@
 from typing import Any
 
 from ..base import SlashCommand, CommandResult
+from ...history import get_session_store
 from ...utils import format_timestamp
 
 
@@ -22,8 +23,6 @@ class SessionsCommand(SlashCommand):
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute sessions command."""
-        from ...history import get_session_store
-        
         store = get_session_store()
         parts = args.strip().split(maxsplit=1)
         subcommand = parts[0].lower() if parts else "list"
@@ -2,6 +2,8 @@
 from typing import Any
 
 from ..base import SlashCommand, CommandResult
+from ...config import get_config
+from ...rich_ui.falling_menu import SettingsMenu
 
 
 class SettingsCommand(SlashCommand):
@@ -21,9 +23,6 @@ class SettingsCommand(SlashCommand):
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute settings command."""
-        from ...config import get_config
-        from ...rich_ui.falling_menu import SettingsMenu
-        
         config = get_config()
         parts = args.strip().split(maxsplit=1)
         
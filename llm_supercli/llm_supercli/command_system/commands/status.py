@@ -2,6 +2,11 @@
 from typing import Any
 
 from ..base import SlashCommand, CommandResult
+from ...auth import get_session_manager
+from ...config import get_config
+from ...history import get_session_store
+from ...llm import get_provider_registry
+from ...mcp import get_mcp_manager
 
 
 class StatusCommand(SlashCommand):
@@ -13,12 +18,6 @@ class StatusCommand(SlashCommand):
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
         """Execute status command."""
-        from ...config import get_config
-        from ...llm import get_provider_registry
-        from ...mcp import get_mcp_manager
-        from ...history import get_session_store
-        from ...auth import get_session_manager
-        
         config = get_config()
         registry = get_provider_registry()
         mcp = get_mcp_manager()
@@ -1,4 +1,5 @@
 """Terminal setup command for llm_supercli."""
+import sys
 from typing import Any
 from ..base import SlashCommand, CommandResult
 
@@ -11,8 +12,6 @@ class TerminalSetupCommand(SlashCommand):
     aliases = ["setup"]
     
     def run(self, args: str = "", **kwargs: Any) -> CommandResult:
-        import sys
-        
         shell_configs = {
             "bash": {
                 "file": "~/.bashrc",
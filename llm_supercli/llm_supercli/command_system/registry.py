@@ -5,7 +5,7 @@ Handles command registration, discovery, and lookup.
 import importlib
 import pkgutil
 from pathlib import Path
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Tuple, Type
 
 from .base import SlashCommand, CommandResult
 
@@ -32,6 +32,10 @@ class CommandRegistry:
         self._initialized = True
         self._commands: Dict[str, SlashCommand] = {}
         self._aliases: Dict[str, str] = {}
+        # Bumped on every register/unregister so listings can be cached
+        self._version = 0
+        # get_sorted_commands() result and the version it was built for
+        self._sorted_cache: Optional[Tuple[int, Tuple[dict, ...], int]] = None
         self._discover_commands()
     
     def _discover_commands(self) -> None:
@@ -80,6 +84,7 @@ class CommandRegistry:
         
         for alias in command.aliases:
             self._aliases[alias] = command.name
+        self._version += 1
     
     def unregister(self, name: str) -> bool:
         """
@@ -97,6 +102,7 @@ class CommandRegistry:
                 if alias in self._aliases:
                     del self._aliases[alias]
             del self._commands[name]
+            self._version += 1
             return True
         return False
     
@@ -199,6 +205,24 @@ class CommandRegistry:
             })
         return commands
     
+    def get_sorted_commands(self) -> Tuple[Tuple[dict, ...], int]:
+        """
+        Get visible commands sorted by name, with the longest name length.
+        
+        The result is memoized until a command is registered or unregistered.
+        
+        Returns:
+            Tuple of (command info dicts, length of the longest name)
+        """
+        cached = self._sorted_cache
+        if cached is not None and cached[0] == self._version:
+            return cached[1], cached[2]
+        
+        commands = tuple(self.list_commands())
+        max_name_len = max(len(cmd['name']) for cmd in commands) if commands else 10
+        self._sorted_cache = (self._version, commands, max_name_len)
+        return commands, max_name_len
+    
     def list_command_names(self) -> List[str]:
         """List all command names (including aliases)."""
         names = list(self._commands.keys())
@@ -247,6 +271,11 @@ class CommandRegistry:
         """Check if a command exists."""
         return name.lower() in self._commands or name.lower() in self._aliases
     
+    @property
+    def version(self) -> int:
+        """Get a counter that changes whenever the set of commands changes."""
+        return self._version
+    
     @property
     def command_count(self) -> int:
         """Get number of registered commands."""
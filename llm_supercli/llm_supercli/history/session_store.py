@@ -58,6 +58,17 @@ class ChatSession:
             self.created_at = time.time()
         if self.updated_at == 0:
             self.updated_at = self.created_at
+        # Non-system messages as API dicts, kept alongside self.messages so
+        # get_conversation() only converts messages added since the last call
+        self._conversation: list[dict] = []
+        self._conversation_source: Optional[list[Message]] = None
+        self._conversation_len = 0
+        self._conversation_last: Optional[Message] = None
+        # Messages already written by SessionStore.save_session, recorded the
+        # same way so only messages added since the last save are written
+        self._saved_source: Optional[list[Message]] = None
+        self._saved_len = 0
+        self._saved_last: Optional[Message] = None
     
     def add_message(self, role: str, content: str, tokens: int = 0, cost: float = 0.0) -> Message:
         """
@@ -110,6 +121,40 @@ class ChatSession:
         context.extend([msg.to_dict() for msg in messages])
         return context
     
+    def get_conversation(self) -> list[dict]:
+        """
+        Get non-system messages formatted for LLM context.
+        
+        Equivalent to filtering system messages out of get_context(). Only
+        messages appended since the previous call are converted; the list is
+        rebuilt if messages were removed or replaced.
+        
+        Returns:
+            List of message dicts without the system prompt or system messages
+        """
+        messages = self.messages
+        start = self._conversation_len
+        if not (
+            messages is self._conversation_source
+            and len(messages) >= start
+            and (start == 0 or messages[start - 1] is self._conversation_last)
+        ):
+            self._conversation = []
+            self._conversation_source = messages
+            start = 0
+        
+        if len(messages) > start:
+            self._conversation.extend(
+                msg.to_dict() for msg in messages[start:] if msg.role != "system"
+            )
+            self._conversation_len = len(messages)
+            self._conversation_last = messages[-1]
+        elif start == 0:
+            self._conversation_len = 0
+            self._conversation_last = None
+        
+        return list(self._conversation)
+    
     def clear_messages(self) -> None:
         """Clear all messages from session."""
         self.messages.clear()
@@ -219,46 +264,90 @@ class SessionStore:
         
         session.updated_at = time.time()
         
-        self._db.update(
-            "sessions",
-            {
-                "title": session.title,
-                "provider": session.provider,
-                "model": session.model,
-                "system_prompt": session.system_prompt,
-                "updated_at": session.updated_at,
-                "message_count": session.message_count,
-                "total_tokens": session.total_tokens,
-                "total_cost": session.total_cost,
-                "is_favorite": 1 if session.is_favorite else 0,
-                "metadata": json.dumps(session.metadata)
-            },
-            "id = ?",
-            (session.id,)
-        )
+        # The row update, any rewrite and the appended messages are committed
+        # together so a failure can't leave a half-written transcript
+        with self._db.transaction():
+            self._db.execute(
+                """UPDATE sessions SET title = ?, provider = ?, model = ?,
+                   system_prompt = ?, updated_at = ?, message_count = ?,
+                   total_tokens = ?, total_cost = ?, is_favorite = ?,
+                   metadata = ? WHERE id = ?""",
+                (
+                    session.title,
+                    session.provider,
+                    session.model,
+                    session.system_prompt,
+                    session.updated_at,
+                    session.message_count,
+                    session.total_tokens,
+                    session.total_cost,
+                    1 if session.is_favorite else 0,
+                    json.dumps(session.metadata),
+                    session.id,
+                ),
+                commit=False
+            )
+            
+            # Messages are written append-only; if any were removed or replaced
+            # since the last save (rewind, /compress), rewrite them all
+            messages = session.messages
+            start = session._saved_len
+            if not (
+                messages is session._saved_source
+                and len(messages) >= start
+                and (start == 0 or messages[start - 1] is session._saved_last)
+            ):
+                self._db.execute(
+                    "DELETE FROM messages WHERE session_id = ?",
+                    (session.id,),
+                    commit=False
+                )
+                start = 0
+            
+            for message in messages[start:]:
+                self.save_message(session.id, message, commit=False)
+        self._mark_saved(session)
+    
+    def _mark_saved(self, session: ChatSession) -> None:
+        """Record that all current messages of a session are in the database."""
+        session._saved_source = session.messages
+        session._saved_len = len(session.messages)
+        session._saved_last = session.messages[-1] if session.messages else None
     
-    def save_message(self, session_id: str, message: Message) -> int:
+    def save_message(
+        self,
+        session_id: str,
+        message: Message,
+        commit: bool = True
+    ) -> int:
         """
         Save a message to the database.
         
         Args:
             session_id: Session ID
             message: Message to save
+            commit: Whether to commit transaction
             
         Returns:
             Message ID
         """
-        msg_id = self._db.insert("messages", {
-            "session_id": session_id,
-            "role": message.role,
-            "content": message.content,
-            "timestamp": message.timestamp,
-            "tokens": message.tokens,
-            "cost": message.cost,
-            "metadata": json.dumps(message.metadata)
-        })
-        message.id = msg_id
-        return msg_id
+        cursor = self._db.execute(
+            """INSERT INTO messages
+               (session_id, role, content, timestamp, tokens, cost, metadata)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            (
+                session_id,
+                message.role,
+                message.content,
+                message.timestamp,
+                message.tokens,
+                message.cost,
+                json.dumps(message.metadata),
+            ),
+            commit=commit
+        )
+        message.id = cursor.lastrowid
+        return message.id
     
     def load_session(self, session_id: str) -> Optional[ChatSession]:
         """
@@ -294,7 +383,7 @@ class SessionStore:
         )
         
         message_rows = self._db.fetch_all(
-            "SELECT * FROM messages WHERE session_id = ? ORDER BY timestamp",
+            "SELECT * FROM messages WHERE session_id = ? ORDER BY id",
             (session_id,)
         )
         
@@ -308,6 +397,7 @@ class SessionStore:
                 cost=msg_row["cost"],
                 metadata=json.loads(msg_row["metadata"]) if msg_row["metadata"] else {}
             ))
+        self._mark_saved(session)
         
         self._current_session = session
         return session
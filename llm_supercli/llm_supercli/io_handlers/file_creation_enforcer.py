@@ -152,8 +152,16 @@ class FileCreationDetector:
         (r"(?i)\b(save|output|write)\s+(to|as)\s+['\"]?[\w\-\_\.\/]+\.\w+['\"]?\b", "create_file", 0.4),
     ]
     
+    # Every creation pattern starts with one of these verbs; input without
+    # any of them (plain chat) cannot match and skips the full pattern scan
+    TRIGGER_PATTERN: str = (
+        r"(?i)\b(create|make|write|generate|build|scaffold|set\s+up|setup|"
+        r"initialize|init|start|begin|implement|code|save|output)\b"
+    )
+    
     def __init__(self) -> None:
         """Initialize the detector with compiled patterns."""
+        self._trigger = re.compile(self.TRIGGER_PATTERN)
         self._patterns = [
             (re.compile(pattern), req_type, boost)
             for pattern, req_type, boost in self.CREATION_PATTERNS
@@ -171,7 +179,7 @@ class FileCreationDetector:
             
         Requirements: 2.1 - Detect "create file/project" type requests
         """
-        if not user_input:
+        if not user_input or not self._trigger.search(user_input):
             return FileCreationRequest(detected=False)
         
         best_match: Optional[FileCreationRequest] = None
@@ -2,9 +2,35 @@
 Base classes for LLM providers in llm_supercli.
 Defines the abstract interface that all providers must implement.
 """
+import asyncio
+import json
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Any, AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, AsyncIterator, Optional
+
+import httpx
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+
+# JSON decoder for streamed response chunks; orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so providers catch the stdlib exception either way
+json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Keep-alive pool of each provider's HTTP client, so tool loops that call the
+# API several times per message reuse one TLS connection
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0)
 
 
 @dataclass
@@ -71,6 +97,8 @@ class LLMProvider(ABC):
         self._api_key = self._config.api_key
         self._model = self._config.default_model
         self._headers: dict[str, str] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
     
     @abstractmethod
     def _default_config(self) -> ProviderConfig:
@@ -231,6 +259,33 @@ class LLMProvider(ABC):
             "cost_per_1k_output": self._config.cost_per_1k_output,
         }
     
+    @asynccontextmanager
+    async def _http_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Get the provider's pooled HTTP client.
+        
+        The client outlives the block, so connections are kept alive between
+        requests (over HTTP/2 when h2 is installed). A new client is created
+        per event loop, since connections cannot move between loops.
+        
+        Yields:
+            Shared httpx.AsyncClient
+        """
+        loop = asyncio.get_running_loop()
+        client = self._client
+        if client is None or client.is_closed or self._client_loop is not loop:
+            client = httpx.AsyncClient(http2=HAS_H2, limits=_HTTP_LIMITS)
+            self._client = client
+            self._client_loop = loop
+        yield client
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client if it belongs to the running loop."""
+        client = self._client
+        self._client = None
+        if client is not None and self._client_loop is asyncio.get_running_loop():
+            await client.aclose()
+    
     def _build_headers(self) -> dict[str, str]:
         """Build request headers with authentication."""
         headers = {
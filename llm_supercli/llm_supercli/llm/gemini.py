@@ -11,7 +11,7 @@ from typing import Any, AsyncGenerator, Optional
 import asyncio
 import httpx
 
-from .base import LLMProvider, LLMResponse, ProviderConfig, StreamChunk
+from .base import LLMProvider, LLMResponse, ProviderConfig, StreamChunk, json_loads
 
 
 # Code Assist API Configuration
@@ -106,7 +106,7 @@ class GeminiProvider(LLMProvider):
                 pass
         
         # Try fetching from remote config
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             try:
                 response = await client.get(EXTENSION_CONFIG_URL, timeout=30.0)
                 if response.status_code == 200:
@@ -176,7 +176,7 @@ class GeminiProvider(LLMProvider):
                 "Please re-login with: /login gemini"
             )
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 "https://oauth2.googleapis.com/token",
                 data={
@@ -229,7 +229,7 @@ class GeminiProvider(LLMProvider):
         url = f"{CODE_ASSIST_ENDPOINT}/{CODE_ASSIST_API_VERSION}:{method}"
         
         for attempt in range(max_retries + 1):
-            async with httpx.AsyncClient() as client:
+            async with self._http_client() as client:
                 try:
                     response = await client.post(
                         url,
@@ -395,7 +395,7 @@ class GeminiProvider(LLMProvider):
         
         start_time = time.perf_counter()
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 url,
                 headers={
@@ -507,7 +507,7 @@ class GeminiProvider(LLMProvider):
         max_retries = 3
         
         for attempt in range(max_retries + 1):
-            async with httpx.AsyncClient() as client:
+            async with self._http_client() as client:
                 try:
                     async with client.stream(
                         "POST",
@@ -552,7 +552,7 @@ class GeminiProvider(LLMProvider):
                                     return
                                 
                                 try:
-                                    data = json.loads(data_str)
+                                    data = json_loads(data_str)
                                     response_data = data.get("response", data)
                                     
                                     if response_data.get("candidates"):
@@ -1,12 +1,13 @@
 """
 Groq LLM provider implementation for llm_supercli.
 """
+import json
 import time
 from typing import Any, AsyncGenerator, Optional
 
 import httpx
 
-from .base import LLMProvider, LLMResponse, ProviderConfig, StreamChunk
+from .base import LLMProvider, LLMResponse, ProviderConfig, StreamChunk, json_loads
 
 
 class GroqProvider(LLMProvider):
@@ -91,7 +92,7 @@ class GroqProvider(LLMProvider):
         
         start_time = time.perf_counter()
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self._config.base_url}/chat/completions",
                 headers=self._build_headers(),
@@ -143,7 +144,7 @@ class GroqProvider(LLMProvider):
             **kwargs
         }
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             async with client.stream(
                 "POST",
                 f"{self._config.base_url}/chat/completions",
@@ -162,8 +163,7 @@ class GroqProvider(LLMProvider):
                         break
                     
                     try:
-                        import json
-                        data = json.loads(data_str)
+                        data = json_loads(data_str)
                         
                         if "choices" in data and data["choices"]:
                             choice = data["choices"][0]
@@ -181,7 +181,7 @@ class GroqProvider(LLMProvider):
     
     async def list_models(self) -> list[str]:
         """List available models from Groq API."""
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             try:
                 response = await client.get(
                     f"{self._config.base_url}/models",
@@ -1,12 +1,13 @@
 """
 HuggingFace Inference API provider implementation for llm_supercli.
 """
+import json
 import time
 from typing import Any, AsyncGenerator, Optional
 
 import httpx
 
-from .base import LLMProvider, LLMResponse, ProviderConfig, StreamChunk
+from .base import LLMProvider, LLMResponse, ProviderConfig, StreamChunk, json_loads
 
 
 class HuggingFaceProvider(LLMProvider):
@@ -109,7 +110,7 @@ class HuggingFaceProvider(LLMProvider):
         
         start_time = time.perf_counter()
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 self._get_api_url(model),
                 headers=self._build_headers(),
@@ -182,7 +183,7 @@ class HuggingFaceProvider(LLMProvider):
             "stream": True
         }
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             async with client.stream(
                 "POST",
                 self._get_api_url(model),
@@ -202,8 +203,7 @@ class HuggingFaceProvider(LLMProvider):
                             continue
                         
                         try:
-                            import json
-                            data = json.loads(data_str)
+                            data = json_loads(data_str)
                             
                             token = data.get("token", {})
                             content = token.get("text", "")
@@ -256,7 +256,7 @@ class HuggingFaceProvider(LLMProvider):
         """
         model = model or self._model
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             try:
                 response = await client.get(
                     f"https://huggingface.co/api/models/{model}",
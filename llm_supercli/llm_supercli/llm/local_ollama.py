@@ -1,12 +1,13 @@
 """
 Ollama (local) LLM provider implementation for llm_supercli.
 """
+import json
 import time
 from typing import Any, AsyncGenerator, Optional
 
 import httpx
 
-from .base import LLMProvider, LLMResponse, ProviderConfig, StreamChunk
+from .base import LLMProvider, LLMResponse, ProviderConfig, StreamChunk, json_loads
 
 
 class OllamaProvider(LLMProvider):
@@ -105,7 +106,7 @@ class OllamaProvider(LLMProvider):
         
         start_time = time.perf_counter()
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self._host}/api/chat",
                 json=payload,
@@ -157,7 +158,7 @@ class OllamaProvider(LLMProvider):
             }
         }
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             async with client.stream(
                 "POST",
                 f"{self._host}/api/chat",
@@ -171,8 +172,7 @@ class OllamaProvider(LLMProvider):
                         continue
                     
                     try:
-                        import json
-                        data = json.loads(line)
+                        data = json_loads(line)
                         
                         content = data.get("message", {}).get("content", "")
                         
@@ -187,7 +187,7 @@ class OllamaProvider(LLMProvider):
     
     async def list_models(self) -> list[str]:
         """List locally available models from Ollama."""
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             try:
                 response = await client.get(
                     f"{self._host}/api/tags",
@@ -209,7 +209,7 @@ class OllamaProvider(LLMProvider):
         Yields:
             Progress updates as dicts
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             async with client.stream(
                 "POST",
                 f"{self._host}/api/pull",
@@ -221,8 +221,7 @@ class OllamaProvider(LLMProvider):
                 async for line in response.aiter_lines():
                     if line:
                         try:
-                            import json
-                            yield json.loads(line)
+                            yield json_loads(line)
                         except json.JSONDecodeError:
                             continue
     
@@ -236,7 +235,7 @@ class OllamaProvider(LLMProvider):
         Returns:
             True if deleted
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             try:
                 response = await client.delete(
                     f"{self._host}/api/delete",
@@ -259,7 +258,7 @@ class OllamaProvider(LLMProvider):
         """
         model = model or self._model
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             try:
                 response = await client.post(
                     f"{self._host}/api/show",
@@ -286,7 +285,7 @@ class OllamaProvider(LLMProvider):
         Returns:
             Embedding vector
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self._host}/api/embeddings",
                 json={
@@ -306,7 +305,7 @@ class OllamaProvider(LLMProvider):
         Returns:
             True if server is accessible
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             try:
                 response = await client.get(
                     f"{self._host}/api/tags",
@@ -1,12 +1,13 @@
 """
 OpenRouter LLM provider implementation for llm_supercli.
 """
+import json
 import time
 from typing import Any, AsyncGenerator, Optional
 
 import httpx
 
-from .base import LLMProvider, LLMResponse, ProviderConfig, StreamChunk
+from .base import LLMProvider, LLMResponse, ProviderConfig, StreamChunk, json_loads
 
 
 class OpenRouterProvider(LLMProvider):
@@ -104,7 +105,7 @@ class OpenRouterProvider(LLMProvider):
         
         start_time = time.perf_counter()
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self._config.base_url}/chat/completions",
                 headers=self._build_headers(),
@@ -156,7 +157,7 @@ class OpenRouterProvider(LLMProvider):
             **kwargs
         }
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             async with client.stream(
                 "POST",
                 f"{self._config.base_url}/chat/completions",
@@ -175,8 +176,7 @@ class OpenRouterProvider(LLMProvider):
                         break
                     
                     try:
-                        import json
-                        data = json.loads(data_str)
+                        data = json_loads(data_str)
                         
                         if "choices" in data and data["choices"]:
                             choice = data["choices"][0]
@@ -194,7 +194,7 @@ class OpenRouterProvider(LLMProvider):
     
     async def list_models(self) -> list[str]:
         """List available models from OpenRouter API."""
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             try:
                 response = await client.get(
                     f"{self._config.base_url}/models",
@@ -217,7 +217,7 @@ class OpenRouterProvider(LLMProvider):
         Returns:
             Generation stats or None
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             try:
                 response = await client.get(
                     f"{self._config.base_url}/generation?id={generation_id}",
@@ -231,6 +231,11 @@ class ProviderRegistry:
         """Clear cached provider instances."""
         self._instances.clear()
     
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients of cached provider instances."""
+        for provider in self._instances.values():
+            await provider.aclose()
+    
     def set_api_key(self, provider_name: str, api_key: str) -> bool:
         """
         Set API key for a provider.
@@ -12,7 +12,7 @@ from urllib.parse import urlencode
 
 import httpx
 
-from .base import LLMProvider, LLMResponse, ProviderConfig, StreamChunk
+from .base import LLMProvider, LLMResponse, ProviderConfig, StreamChunk, json_loads
 
 
 # Qwen OAuth Configuration
@@ -123,7 +123,7 @@ class QwenProvider(LLMProvider):
             "Referer": f"{QWEN_OAUTH_BASE_URL}/",
         }
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 QWEN_OAUTH_TOKEN_ENDPOINT,
                 headers=headers,
@@ -216,7 +216,7 @@ class QwenProvider(LLMProvider):
         
         start_time = time.perf_counter()
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{base_url}/chat/completions",
                 headers={
@@ -317,7 +317,7 @@ class QwenProvider(LLMProvider):
             **kwargs
         }
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             try:
                 async with client.stream(
                     "POST",
@@ -363,7 +363,7 @@ class QwenProvider(LLMProvider):
                             break
                         
                         try:
-                            data = json.loads(data_str)
+                            data = json_loads(data_str)
                             
                             if "choices" in data and data["choices"]:
                                 choice = data["choices"][0]
@@ -1,12 +1,13 @@
 """
 Together AI LLM provider implementation for llm_supercli.
 """
+import json
 import time
 from typing import Any, AsyncGenerator, Optional
 
 import httpx
 
-from .base import LLMProvider, LLMResponse, ProviderConfig, StreamChunk
+from .base import LLMProvider, LLMResponse, ProviderConfig, StreamChunk, json_loads
 
 
 class TogetherProvider(LLMProvider):
@@ -94,7 +95,7 @@ class TogetherProvider(LLMProvider):
         
         start_time = time.perf_counter()
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self._config.base_url}/chat/completions",
                 headers=self._build_headers(),
@@ -146,7 +147,7 @@ class TogetherProvider(LLMProvider):
             **kwargs
         }
         
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             async with client.stream(
                 "POST",
                 f"{self._config.base_url}/chat/completions",
@@ -165,8 +166,7 @@ class TogetherProvider(LLMProvider):
                         break
                     
                     try:
-                        import json
-                        data = json.loads(data_str)
+                        data = json_loads(data_str)
                         
                         if "choices" in data and data["choices"]:
                             choice = data["choices"][0]
@@ -184,7 +184,7 @@ class TogetherProvider(LLMProvider):
     
     async def list_models(self) -> list[str]:
         """List available models from Together AI API."""
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             try:
                 response = await client.get(
                     f"{self._config.base_url}/models",
@@ -217,7 +217,7 @@ class TogetherProvider(LLMProvider):
         Returns:
             List of embedding vectors
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self._config.base_url}/embeddings",
                 headers=self._build_headers(),
@@ -146,6 +146,13 @@ class ModeManager:
         """
         return slug in self._modes
     
+    def __contains__(self, slug: object) -> bool:
+        """Support ``slug in manager`` as a cheap existence check.
+        
+        Unlike get(), this never falls back to the default mode.
+        """
+        return slug in self._modes
+    
     def list_modes(self) -> list[ModeConfig]:
         """List all registered modes.
         
@@ -64,6 +64,33 @@ class RulesLoader:
         
         return rules
     
+    def signature(self, cwd: Path) -> tuple:
+        """Fingerprint the rule files load() would read, without reading them.
+        
+        Args:
+            cwd: The current working directory to check local rules in.
+            
+        Returns:
+            Tuple of (path, mtime_ns, size) for every rule file; it changes
+            whenever a rule file is added, removed or edited.
+        """
+        candidates: list[Path] = []
+        for directory in (self.GLOBAL_RULES_DIR, cwd / self.LOCAL_RULES_DIR):
+            try:
+                candidates.extend(directory.iterdir())
+            except OSError:
+                pass
+        candidates.extend(cwd / name for name in self.LEGACY_FILES)
+        
+        entries = []
+        for path in candidates:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(entries))
+    
     def _load_from_directory(self, directory: Path, source: str) -> list[RuleFile]:
         """Load rule files from a directory.
         
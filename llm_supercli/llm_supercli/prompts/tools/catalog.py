@@ -219,6 +219,16 @@ class ToolCatalog:
         """
         self._tools: list[ToolDefinition] = list(tools) if tools else []
         self._disabled_tools: set[str] = set()
+        # OpenAI-format tool lists keyed on a mode's tool groups; cleared
+        # whenever the set of tools or disabled tools changes
+        self._openai_cache: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        # Bumped on every such change, so callers can key their own caches on it
+        self._version = 0
+    
+    def _changed(self) -> None:
+        """Record that the set of tools or disabled tools changed."""
+        self._openai_cache.clear()
+        self._version += 1
     
     def add_tool(self, tool: ToolDefinition) -> None:
         """Add a tool to the catalog.
@@ -227,6 +237,7 @@ class ToolCatalog:
             tool: The tool definition to add.
         """
         self._tools.append(tool)
+        self._changed()
     
     def add_mcp_tool(self, mcp_tool: dict[str, Any]) -> None:
         """Add an MCP tool to the catalog.
@@ -242,6 +253,7 @@ class ToolCatalog:
             enabled=True,
         )
         self._tools.append(tool)
+        self._changed()
     
     def disable_tool(self, name: str) -> None:
         """Disable a tool by name.
@@ -250,6 +262,7 @@ class ToolCatalog:
             name: The name of the tool to disable.
         """
         self._disabled_tools.add(name)
+        self._changed()
     
     def enable_tool(self, name: str) -> None:
         """Enable a previously disabled tool.
@@ -258,6 +271,7 @@ class ToolCatalog:
             name: The name of the tool to enable.
         """
         self._disabled_tools.discard(name)
+        self._changed()
     
     def is_tool_disabled(self, name: str) -> bool:
         """Check if a tool is disabled.
@@ -279,6 +293,11 @@ class ToolCatalog:
     def disabled_tools(self) -> set[str]:
         """Get the set of disabled tool names."""
         return set(self._disabled_tools)
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever tools are added, disabled or enabled."""
+        return self._version
 
 
     def filter_for_mode(
@@ -305,6 +324,28 @@ class ToolCatalog:
             and tool.enabled
         ]
     
+    def openai_tools_for_mode(
+        self,
+        mode: Any,  # ModeConfig
+    ) -> list[dict[str, Any]]:
+        """Get the tools allowed for a mode in OpenAI format.
+        
+        The converted list is built once per set of tool groups and reused
+        for every request, so callers must not modify it.
+        
+        Args:
+            mode: The ModeConfig specifying allowed tool_groups.
+            
+        Returns:
+            List of tool definitions in OpenAI format for native tool calling.
+        """
+        key = tuple(mode.tool_groups) if mode.tool_groups else ()
+        tools = self._openai_cache.get(key)
+        if tools is None:
+            tools = [tool.to_openai_format() for tool in self.filter_for_mode(mode)]
+            self._openai_cache[key] = tools
+        return tools
+    
     def render(
         self,
         mode: Any,  # ModeConfig
@@ -1,8 +1,9 @@
 """Tool executor for handling LLM tool calls."""
 import os
 import subprocess
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from ...io_handlers.error_handler import (
     EmptyDirectoryHandler,
@@ -14,9 +15,16 @@ from ...io_handlers.error_handler import (
 class ToolExecutor:
     """Executes tool calls from LLM responses."""
     
+    # Files whose read_file results are kept for repeated reads
+    READ_CACHE_SIZE = 128
+    
     def __init__(self, working_dir: Optional[str] = None):
         self.working_dir = working_dir or os.getcwd()
         self._error_handler = get_error_handler()
+        # read_file results by resolved path as (st_mtime_ns, st_size, content);
+        # read-only tools may run in worker threads, hence the lock
+        self._read_cache: Dict[Path, Tuple[int, int, str]] = {}
+        self._read_cache_lock = threading.Lock()
     
     def execute(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """Execute a tool and return the result as a string."""
@@ -105,16 +113,46 @@ class ToolExecutor:
         if not file_path.is_file():
             return f"Error: '{path}' is not a file"
         
+        # Models often re-read the same file; reuse it while it is unchanged
+        try:
+            stat = file_path.stat()
+        except OSError:
+            stat = None
+        if stat is not None:
+            cached = self._read_cache.get(file_path)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return cached[2]
+        
         try:
             content = file_path.read_text(encoding='utf-8')
             if len(content) > 50000:
                 content = content[:50000] + f"\n\n... [truncated, file has {len(content)} characters total]"
+            if stat is not None:
+                with self._read_cache_lock:
+                    cache = self._read_cache
+                    cache.pop(file_path, None)
+                    if len(cache) >= self.READ_CACHE_SIZE:
+                        # Evict the oldest entry
+                        del cache[next(iter(cache))]
+                    cache[file_path] = (stat.st_mtime_ns, stat.st_size, content)
             return content
         except UnicodeDecodeError:
             return f"Error: File '{path}' is not a text file or has encoding issues"
         except PermissionError:
             return f"Error: Permission denied reading '{path}'"
     
+    def _invalidate_read_cache(self, file_path: Optional[Path] = None) -> None:
+        """Drop a cached read, or every cached read if no path is given.
+        
+        A rewrite can keep a file's size and land within its mtime
+        resolution, so tools that change files must not rely on the stat check.
+        """
+        with self._read_cache_lock:
+            if file_path is None:
+                self._read_cache.clear()
+            else:
+                self._read_cache.pop(file_path, None)
+    
     def _write_file(self, path: str, content: str) -> str:
         """Write content to a file.
         
@@ -144,6 +182,9 @@ class ToolExecutor:
             return self._error_handler.handle_write_file_error(
                 f"Encoding error: {str(e)}", path
             )
+        finally:
+            # Even a failed write may have truncated the file
+            self._invalidate_read_cache(file_path)
     
     def _create_directory(self, path: str) -> str:
         """Create a directory."""
@@ -186,3 +227,6 @@ class ToolExecutor:
             return "Error: Command timed out after 30 seconds"
         except Exception as e:
             return f"Error running command: {str(e)}"
+        finally:
+            # The command may have changed any file
+            self._invalidate_read_cache()
@@ -13,6 +13,7 @@ import re
 import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
 
@@ -30,6 +31,16 @@ class ParsedToolCall:
     arguments: dict[str, Any]
     raw_text: str
     parser_name: str
+    
+    @cached_property
+    def dedup_key(self) -> str:
+        """Key identifying this call by tool name and arguments.
+        
+        Two calls with the same tool and arguments share a key regardless of
+        argument order. Computed once per instance, so arguments must not be
+        mutated afterwards.
+        """
+        return f"{self.name}:{tuple(sorted(self.arguments.items()))!r}"
 
 
 class FormatParser(ABC):
@@ -31,6 +31,7 @@ from .skipped_tool_detector import (
     SkippedToolDetection,
     get_skipped_tool_detector,
     detect_skipped_tools,
+    find_skipped_tool,
 )
 from .streaming_progress import (
     StreamingProgressIndicator,
@@ -72,6 +73,7 @@ __all__ = [
     'ReasoningDisplay', 'ReasoningChunk', 'get_reasoning_display', 'display_reasoning',
     # Skipped tool detector
     'SkippedToolDetector', 'SkippedToolDetection', 'get_skipped_tool_detector', 'detect_skipped_tools',
+    'find_skipped_tool',
     # Streaming progress indicator
     'StreamingProgressIndicator', 'StreamingProgressConfig', 'DEFAULT_THINKING_TIMEOUT',
 ]
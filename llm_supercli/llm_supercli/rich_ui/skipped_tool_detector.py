@@ -8,7 +8,7 @@ Requirements: 4.4 - Warn user when tool invocation is skipped or simulated
 """
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 
 @dataclass
@@ -77,15 +77,19 @@ class SkippedToolDetector:
         r"run_command\s*\(",
     ]
     
+    # Confidence boosts for explicit phrasing, applied by _calculate_confidence
+    _FUTURE_TENSE_RE = re.compile(r"(?i)i'?ll |i will |i'm going to ")
+    _LET_ME_RE = re.compile(r"(?i)let me ")
+    _PROGRESSIVE_RE = re.compile(r"(?i)ing ")
+    
     def __init__(self) -> None:
         """Initialize the detector with compiled patterns."""
-        self._action_patterns = [
+        self._action_patterns = tuple(
             (re.compile(pattern), tool, group)
             for pattern, tool, group in self.ACTION_PATTERNS
-        ]
-        self._tool_patterns = [
-            re.compile(pattern) for pattern in self.TOOL_CALL_PATTERNS
-        ]
+        )
+        # All tool call patterns as one alternation, searched in a single pass
+        self._tool_pattern = re.compile("|".join(self.TOOL_CALL_PATTERNS))
     
     def detect(
         self,
@@ -105,27 +109,51 @@ class SkippedToolDetector:
         Returns:
             List of SkippedToolDetection results for each detected skip
             
+        Requirements: 4.4 - Detect when LLM describes action without invoking tool
+        """
+        return list(self.iter_detect(response, tool_calls_made))
+    
+    def iter_detect(
+        self,
+        response: str,
+        tool_calls_made: Optional[List[str]] = None,
+        min_confidence: float = 0.5
+    ) -> Iterator[SkippedToolDetection]:
+        """
+        Lazily yield skipped tool invocations, at most one per suggested tool.
+        
+        Patterns are only searched as far as the caller consumes the
+        iterator, so callers that need a single detection can stop early.
+        
+        Args:
+            response: The LLM response text to analyze
+            tool_calls_made: Optional list of tool names that were actually called
+            min_confidence: Lowest confidence a detection must reach to be yielded
+            
+        Yields:
+            SkippedToolDetection results in pattern order
+            
         Requirements: 4.4 - Detect when LLM describes action without invoking tool
         """
         if not response:
-            return []
+            return
         
-        tool_calls_made = tool_calls_made or []
-        detections: List[SkippedToolDetection] = []
+        # Nothing was skipped if there are tool calls in the response
+        if self._has_tool_calls(response):
+            return
         
-        # Check if any tool calls were made in the response
-        has_tool_calls = self._has_tool_calls(response)
+        # Tools that were called, or already reported, are not reported again
+        seen_tools = set(tool_calls_made or ())
         
         # Look for action patterns
         for pattern, suggested_tool, desc_group in self._action_patterns:
-            matches = pattern.finditer(response)
-            for match in matches:
-                # Skip if the tool was actually called
-                if suggested_tool in tool_calls_made:
-                    continue
-                
-                # Skip if there are tool calls in the response
-                if has_tool_calls:
+            if suggested_tool in seen_tools:
+                continue
+            
+            for match in pattern.finditer(response):
+                # Calculate confidence based on pattern strength
+                confidence = self._calculate_confidence(match.group(0))
+                if confidence < min_confidence:
                     continue
                 
                 # Extract the action description
@@ -134,27 +162,14 @@ class SkippedToolDetector:
                 except IndexError:
                     action_desc = match.group(0)
                 
-                # Calculate confidence based on pattern strength
-                confidence = self._calculate_confidence(match.group(0))
-                
-                # Only report if confidence is high enough
-                if confidence >= 0.5:
-                    detections.append(SkippedToolDetection(
-                        detected=True,
-                        action_description=action_desc,
-                        suggested_tool=suggested_tool,
-                        confidence=confidence
-                    ))
-        
-        # Deduplicate detections (same tool suggestion)
-        seen_tools: set = set()
-        unique_detections: List[SkippedToolDetection] = []
-        for detection in detections:
-            if detection.suggested_tool not in seen_tools:
-                seen_tools.add(detection.suggested_tool)
-                unique_detections.append(detection)
-        
-        return unique_detections
+                seen_tools.add(suggested_tool)
+                yield SkippedToolDetection(
+                    detected=True,
+                    action_description=action_desc,
+                    suggested_tool=suggested_tool,
+                    confidence=confidence
+                )
+                break
     
     def _has_tool_calls(self, response: str) -> bool:
         """
@@ -166,10 +181,7 @@ class SkippedToolDetector:
         Returns:
             True if tool calls are present, False otherwise
         """
-        for pattern in self._tool_patterns:
-            if pattern.search(response):
-                return True
-        return False
+        return self._tool_pattern.search(response) is not None
     
     def _calculate_confidence(self, matched_text: str) -> float:
         """
@@ -186,15 +198,15 @@ class SkippedToolDetector:
         confidence = 0.5
         
         # Higher confidence for explicit future tense
-        if re.search(r"(?i)i'?ll |i will |i'm going to ", matched_text):
+        if self._FUTURE_TENSE_RE.search(matched_text):
             confidence += 0.2
         
         # Higher confidence for "let me" patterns
-        if re.search(r"(?i)let me ", matched_text):
+        if self._LET_ME_RE.search(matched_text):
             confidence += 0.2
         
         # Higher confidence for present progressive
-        if re.search(r"(?i)ing ", matched_text):
+        if self._PROGRESSIVE_RE.search(matched_text):
             confidence += 0.1
         
         return min(confidence, 1.0)
@@ -229,3 +241,27 @@ def detect_skipped_tools(
     Requirements: 4.4 - Detect when LLM describes action without invoking tool
     """
     return get_skipped_tool_detector().detect(response, tool_calls_made)
+
+
+def find_skipped_tool(
+    response: str,
+    tool_calls_made: Optional[List[str]] = None,
+    min_confidence: float = 0.5
+) -> Optional[SkippedToolDetection]:
+    """
+    Find the first skipped tool invocation, stopping as soon as one is found.
+    
+    Args:
+        response: The LLM response text to analyze
+        tool_calls_made: Optional list of tool names that were actually called
+        min_confidence: Lowest confidence a detection must reach
+        
+    Returns:
+        The first SkippedToolDetection, or None if nothing was skipped
+        
+    Requirements: 4.4 - Detect when LLM describes action without invoking tool
+    """
+    detections = get_skipped_tool_detector().iter_detect(
+        response, tool_calls_made, min_confidence
+    )
+    return next(detections, None)
@@ -445,7 +445,8 @@ class ToolActionMapper:
         if not content:
             return None
         
-        lines = content.split('\n')[:max_lines]
+        # Split off only the leading lines instead of the whole file
+        lines = content.split('\n', max_lines)[:max_lines]
         return '\n'.join(lines)
     
     def _generate_change_summary(self, content: str) -> Optional[str]:
@@ -4,12 +4,19 @@ Utility functions for llm_supercli.
 import hashlib
 import re
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Optional, TypeVar
 from functools import wraps
 
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
 T = TypeVar('T')
 
 
@@ -30,10 +37,46 @@ def truncate_string(text: str, max_length: int = 100, suffix: str = "...") -> st
     return text[:max_length - len(suffix)] + suffix
 
 
+# The tiktoken encoding, once loaded by warm_token_encoding()
+_encoding: Optional[Any] = None
+_encoding_loader: Optional[threading.Thread] = None
+_encoding_lock = threading.Lock()
+
+
+def _load_encoding() -> None:
+    """Load the tiktoken encoding into _encoding."""
+    global _encoding
+    try:
+        _encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # The encoding file may need downloading, which fails offline
+        pass
+
+
+def warm_token_encoding() -> None:
+    """
+    Start loading the tiktoken encoding in a background thread.
+    
+    The first load may download the encoding file, so it never runs on
+    the caller's thread. Calling this again is a no-op.
+    """
+    global _encoding_loader
+    if not HAS_TIKTOKEN:
+        return
+    with _encoding_lock:
+        if _encoding_loader is None:
+            # Daemon, so a stalled download can't hold up interpreter exit
+            _encoding_loader = threading.Thread(
+                target=_load_encoding, name="tiktoken-loader", daemon=True
+            )
+            _encoding_loader.start()
+
+
 def count_tokens(text: str) -> int:
     """
     Estimate token count for a text string.
-    Uses a simple approximation (4 chars per token).
+    Uses tiktoken's cl100k_base encoding when installed and loaded,
+    otherwise a simple approximation (4 chars per token).
     
     Args:
         text: The text to count tokens for
@@ -41,6 +84,10 @@ def count_tokens(text: str) -> int:
     Returns:
         Estimated token count
     """
+    encoding = _encoding
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    warm_token_encoding()
     return len(text) // 4
 
 
@@ -0,0 +1,149 @@
+"""
+Property-based tests for session persistence.
+
+Tests that saved sessions reload with the same messages, in the same order,
+after appends, rewinds and /compress-style rewrites.
+"""
+
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import allure
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from llm_supercli.history.db import Database
+from llm_supercli.history.session_store import ChatSession, SessionStore
+
+# Strategies for generating test data
+
+def message_strategy():
+    """Generate (role, content) pairs for chat messages."""
+    return st.tuples(
+        st.sampled_from(["user", "assistant", "system"]),
+        st.text(min_size=1, max_size=50)
+    )
+
+
+def messages_strategy(min_size: int = 0, max_size: int = 10):
+    """Generate a list of (role, content) pairs."""
+    return st.lists(message_strategy(), min_size=min_size, max_size=max_size)
+
+
+@contextmanager
+def temp_store() -> Iterator[SessionStore]:
+    """Yield a SessionStore backed by a fresh database in a temp directory."""
+    previous = Database._instance
+    Database._instance = None
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = Database(Path(tmpdir) / "history.db")
+            try:
+                yield SessionStore(db)
+            finally:
+                db.close()
+    finally:
+        Database._instance = previous
+
+
+def stored_messages(store: SessionStore, session: ChatSession) -> list[tuple]:
+    """Reload a session from the database and return its (role, content) pairs."""
+    loaded = store.load_session(session.id)
+    assert loaded is not None
+    return [(m.role, m.content) for m in loaded.messages]
+
+
+def current_messages(session: ChatSession) -> list[tuple]:
+    """Return the in-memory (role, content) pairs of a session."""
+    return [(m.role, m.content) for m in session.messages]
+
+
+@allure.feature("Session History")
+@allure.story("Appended messages survive save and reload")
+@allure.severity(allure.severity_level.CRITICAL)
+@settings(max_examples=25, deadline=None)
+@given(first=messages_strategy(), second=messages_strategy())
+def test_append_then_reload(first: list, second: list):
+    """Saving after each batch of appends stores every message exactly once."""
+    with temp_store() as store:
+        session = store.create_session()
+        for role, content in first:
+            session.add_message(role, content)
+        store.save_session(session)
+        for role, content in second:
+            session.add_message(role, content)
+        store.save_session(session)
+
+        assert stored_messages(store, session) == first + second
+
+
+@allure.feature("Session History")
+@allure.story("Rewound messages are removed from storage")
+@allure.severity(allure.severity_level.CRITICAL)
+@settings(max_examples=25, deadline=None)
+@given(
+    messages=messages_strategy(min_size=1),
+    count=st.integers(min_value=1, max_value=10),
+    replacement=messages_strategy(max_size=3)
+)
+def test_rewind_then_reload(messages: list, count: int, replacement: list):
+    """Rewinding and appending new messages rewrites the stored transcript."""
+    with temp_store() as store:
+        session = store.create_session()
+        for role, content in messages:
+            session.add_message(role, content)
+        store.save_session(session)
+
+        session.rewind(count)
+        for role, content in replacement:
+            session.add_message(role, content)
+        store.save_session(session)
+
+        assert stored_messages(store, session) == current_messages(session)
+
+
+@allure.feature("Session History")
+@allure.story("Compressed sessions reload in the compressed order")
+@allure.severity(allure.severity_level.CRITICAL)
+@settings(max_examples=25, deadline=None)
+@given(messages=messages_strategy(min_size=5))
+def test_compress_then_reload(messages: list):
+    """A summary inserted before older messages keeps its position on reload."""
+    with temp_store() as store:
+        session = store.create_session()
+        for role, content in messages:
+            session.add_message(role, content)
+        store.save_session(session)
+
+        # Mirror /compress: keep system messages, add a newer summary, then
+        # re-append the (older) recent messages after it
+        recent = session.messages[-4:]
+        session.messages = [m for m in session.messages if m.role == "system"]
+        session.add_message("system", "Context summary: test")
+        session.messages.extend(recent)
+        store.save_session(session)
+
+        assert stored_messages(store, session) == current_messages(session)
+
+
+@allure.feature("Session History")
+@allure.story("Reloaded sessions save incrementally")
+@allure.severity(allure.severity_level.NORMAL)
+@settings(max_examples=25, deadline=None)
+@given(first=messages_strategy(), second=messages_strategy())
+def test_reload_then_append(first: list, second: list):
+    """Appending to a reloaded session does not duplicate stored messages."""
+    with temp_store() as store:
+        session = store.create_session()
+        for role, content in first:
+            session.add_message(role, content)
+        store.save_session(session)
+
+        loaded = store.load_session(session.id)
+        for role, content in second:
+            loaded.add_message(role, content)
+        store.save_session(loaded)
+
+        assert stored_messages(store, session) == first + second
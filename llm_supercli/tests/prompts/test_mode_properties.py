@@ -10,6 +10,7 @@ from hypothesis import given, settings, strategies as st, assume
 
 from llm_supercli.prompts.modes import (
     ModeConfig,
+    ModeManager,
     validate_mode_config,
     VALID_TOOL_GROUPS,
 )
@@ -248,3 +249,26 @@ def test_invalid_slug_pattern_rejected(slug: str):
     
     assert not is_valid, f"Config with invalid slug '{slug}' should be rejected"
     assert len(errors) > 0, "Should have at least one error message"
+
+
+@allure.feature("Mode Management")
+@allure.story("Mode membership - contains matches registration")
+@allure.severity(allure.severity_level.NORMAL)
+@settings(max_examples=100)
+@given(config=valid_mode_config_dict())
+def test_mode_membership_matches_registration(config: dict):
+    """
+    For any valid mode configuration, ``slug in manager`` SHALL be True
+    after registration and False after unregistration, matching has_mode().
+    """
+    manager = ModeManager(load_builtin=False)
+    mode = ModeConfig.from_dict(config)
+    
+    assert mode.slug not in manager
+    
+    manager.register(mode)
+    assert mode.slug in manager
+    assert (mode.slug in manager) == manager.has_mode(mode.slug)
+    
+    manager.unregister(mode.slug)
+    assert mode.slug not in manager
@@ -885,3 +885,33 @@ def test_xml_style_parsing_with_cdata(call_data: dict):
     assert result.arguments == expected_args, (
         f"Expected args {expected_args}, got {result.arguments} for: {call_str}"
     )
+
+
+@allure.feature("Tool Parsing")
+@allure.story("Duplicate detection key ignores argument order")
+@allure.severity(allure.severity_level.NORMAL)
+@settings(max_examples=100)
+@given(
+    name=st.sampled_from(["read_file", "write_file", "list_directory", "run_command"]),
+    arguments=st.dictionaries(
+        st.text(alphabet="abcdefghijklmnopqrstuvwxyz_", min_size=1, max_size=10),
+        st.text(max_size=20),
+        max_size=4,
+    ),
+)
+def test_dedup_key_ignores_argument_order(name: str, arguments: dict):
+    """
+    For any tool call, calls with the same name and arguments SHALL share a
+    dedup_key regardless of argument order, and calls to other tools SHALL not.
+    """
+    call = ParsedToolCall(name=name, arguments=arguments, raw_text="", parser_name="python")
+    reordered = ParsedToolCall(
+        name=name,
+        arguments=dict(reversed(list(arguments.items()))),
+        raw_text="other",
+        parser_name="xml",
+    )
+    other_tool = ParsedToolCall(name=name + "_x", arguments=arguments, raw_text="", parser_name="python")
+    
+    assert call.dedup_key == reordered.dedup_key
+    assert call.dedup_key != other_tool.dedup_key
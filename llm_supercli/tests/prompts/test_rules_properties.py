@@ -288,3 +288,28 @@ class TestRulesLoaderIntegration:
         loader = RulesLoader()
         merged = loader.merge([])
         assert merged == ""
+    
+    @allure.story("Signature tracks rule file changes")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_signature_tracks_rule_file_changes(self):
+        """Test that adding, editing and removing rule files changes the signature."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cwd = Path(tmpdir)
+            rules_dir = cwd / ".supercli" / "rules"
+            rules_dir.mkdir(parents=True)
+            
+            loader = RulesLoader()
+            empty = loader.signature(cwd)
+            
+            rule = rules_dir / "a_rule.txt"
+            rule.write_text("Rule A content")
+            added = loader.signature(cwd)
+            assert added != empty
+            assert loader.signature(cwd) == added
+            
+            rule.write_text("Rule A content, edited")
+            edited = loader.signature(cwd)
+            assert edited != added
+            
+            rule.unlink()
+            assert loader.signature(cwd) != edited
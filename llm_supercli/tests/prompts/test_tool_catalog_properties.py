@@ -576,3 +576,29 @@ def test_rendered_parameters_match_tool_definitions(tools: list[ToolDefinition])
                     f"Optional parameter '{param_name}' of tool '{tool.name}' should have '?' marker. "
                     f"Expected pattern: '{optional_pattern}'. Output: {output[:1500]}..."
                 )
+
+
+@allure.feature("Tool Catalog")
+@allure.story("Version changes with the tool set")
+@allure.severity(allure.severity_level.NORMAL)
+@settings(max_examples=100)
+@given(tools=tool_list_strategy(min_size=1, max_size=10))
+def test_version_changes_with_tool_set(tools: list[ToolDefinition]):
+    """
+    Adding, disabling and enabling tools each change the catalog version,
+    so caches keyed on it never serve a prompt built for another tool set.
+    """
+    catalog = ToolCatalog()
+    seen = {catalog.version}
+    
+    for tool in tools:
+        catalog.add_tool(tool)
+        assert catalog.version not in seen
+        seen.add(catalog.version)
+    
+    catalog.disable_tool(tools[0].name)
+    assert catalog.version not in seen
+    seen.add(catalog.version)
+    
+    catalog.enable_tool(tools[0].name)
+    assert catalog.version not in seen